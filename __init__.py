@@ -2,34 +2,97 @@
 
 from __future__ import annotations
 
+import secrets
+
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import ConfigType
 
-from .client import AvantioClient
-from .const import CONF_USERNAME, CONF_PASSWORD, DOMAIN
-from .coordinator import AvantioCoordinator
+from .const import (
+    CONF_FEED_TOKEN,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_REQUESTS_PER_SECOND,
+    CONF_PASSWORD,
+    CONF_STARTUP_JITTER,
+    CONF_USERNAME,
+    DATA_POOL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_REQUESTS_PER_SECOND,
+    DEFAULT_STARTUP_JITTER,
+    DOMAIN,
+)
+from .coordinator import AvantioCoordinator, SnapshotStore
+from .feed import CalendarFeedView
+from .pool import AvantioClientPool
+from .services import async_setup_services
 
-PLATFORMS: list[Platform] = [Platform.CALENDAR, Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.CALENDAR, Platform.SENSOR]
 
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+                ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Optional(
+                    CONF_MAX_REQUESTS_PER_SECOND, default=DEFAULT_MAX_REQUESTS_PER_SECOND
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_STARTUP_JITTER, default=DEFAULT_STARTUP_JITTER
+                ): cv.positive_int,
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
-def setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Your controller/hub specific code."""
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the pool shared by the clients of all config entries, the services and the calendar feeds."""
     hass.data.setdefault(DOMAIN, {})
+    conf = config.get(DOMAIN, {})
+    hass.data[DATA_POOL] = AvantioClientPool(
+        max_concurrent=conf.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+        max_per_second=conf.get(CONF_MAX_REQUESTS_PER_SECOND, DEFAULT_MAX_REQUESTS_PER_SECOND),
+        startup_jitter=conf.get(CONF_STARTUP_JITTER, DEFAULT_STARTUP_JITTER),
+    )
+    async_setup_services(hass)
+    hass.http.register_view(CalendarFeedView(hass))
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Travel Paradise from a config entry."""
-    client = AvantioClient(
-        username=entry.data.get(CONF_USERNAME), password=entry.data.get(CONF_PASSWORD)
+    if CONF_FEED_TOKEN not in entry.data:
+        # Secret of the calendar feeds of the entry
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_FEED_TOKEN: secrets.token_urlsafe(32)}
+        )
+
+    pool: AvantioClientPool = hass.data[DATA_POOL]
+    client = pool.get_client(
+        hass, username=entry.data.get(CONF_USERNAME), password=entry.data.get(CONF_PASSWORD)
     )
 
     coordinator = AvantioCoordinator(hass, client)
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    await coordinator.async_request_refresh()
+    if await coordinator.async_load_snapshot():
+        # Entities are created from the restored data, fresh data is fetched without blocking the startup
+        pool.schedule_refresh(hass, entry, coordinator)
+    else:
+        # The one fetch of the setup: platforms create their entities from its data, without refreshing again
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            hass.data[DOMAIN].pop(entry.entry_id)
+            await coordinator.async_shutdown()
+            raise
 
     # Forward the setup to the platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -45,6 +108,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: AvantioCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the data snapshot of a removed config entry."""
+    await SnapshotStore(hass, entry.entry_id).async_remove()
@@ -0,0 +1,145 @@
+"""Earnings and occupancy of the rentals, by month, per accommodation and for the whole account."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import date
+from decimal import Decimal
+from itertools import accumulate
+
+from .models import Booking
+
+
+def month_index(day: date) -> int:
+    """Return the index of the month of the given day, i.e. the number of months since January of year 0."""
+    return day.year * 12 + day.month - 1
+
+
+def month_start(index: int) -> date:
+    """Return the first day of the month of the given index, see `month_index`."""
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def nights_by_month(start: date, end: date) -> Iterator[tuple[int, int]]:
+    """Split the nights from `start` to `end` by month, yielding the index of each month and its number of nights."""
+    while start < end:
+        index = month_index(start)
+        stop = min(end, month_start(index + 1))
+        yield index, (stop - start).days
+        start = stop
+
+
+class MonthlyTotals:
+    """Earnings and nights booked by month, with prefix sums to total any range of months in constant time.
+
+    Earnings are counted in the month of the check-in, like the yearly earnings, and nights in the month they fall
+    in. Months are updated as bookings are added or removed, and prefix sums are only rebuilt on the first query
+    following a change, hence once per refresh however many sensors query them.
+    """
+
+    __slots__ = ("_earnings", "_nights", "_first", "_earnings_sums", "_nights_sums")
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self._earnings: dict[int, Decimal] = defaultdict(Decimal)
+        self._nights: dict[int, int] = defaultdict(int)
+        # Index of the first month of the prefix sums, which hold one more item than the months they cover
+        self._first = 0
+        self._earnings_sums: list[Decimal] | None = None
+        self._nights_sums: list[int] | None = None
+
+    def add(self, booking: Booking, sign: int = 1) -> None:
+        """Add a booking to the totals, or remove it with a `sign` of -1."""
+        self._earnings[month_index(booking.start.date())] += sign * booking.amount
+        for index, nights in nights_by_month(booking.start.date(), booking.end.date()):
+            self._nights[index] += sign * nights
+        self._earnings_sums = None
+        self._nights_sums = None
+
+    def _ensure_sums(self) -> None:
+        """Rebuild the prefix sums, if the totals changed since they were last built."""
+        if self._earnings_sums is not None:
+            return
+        months = self._earnings.keys() | self._nights.keys()
+        self._first = min(months, default=0)
+        last = max(months, default=-1)
+        self._earnings_sums = [
+            Decimal(0),
+            *accumulate(self._earnings.get(index, Decimal(0)) for index in range(self._first, last + 1)),
+        ]
+        self._nights_sums = [0, *accumulate(self._nights.get(index, 0) for index in range(self._first, last + 1))]
+
+    def _range(self, first: int, last: int) -> tuple[int, int]:
+        """Return the bounds, in the prefix sums, of the months from `first` to `last` included."""
+        self._ensure_sums()
+        size = len(self._earnings_sums) - 1
+        lower = min(max(first - self._first, 0), size)
+        upper = min(max(last + 1 - self._first, lower), size)
+        return lower, upper
+
+    def earnings(self, first: int, last: int) -> Decimal:
+        """Return the earnings of the rentals checking-in from month `first` to month `last` included."""
+        lower, upper = self._range(first, last)
+        return self._earnings_sums[upper] - self._earnings_sums[lower]
+
+    def nights(self, first: int, last: int) -> int:
+        """Return the number of nights booked from month `first` to month `last` included."""
+        lower, upper = self._range(first, last)
+        return self._nights_sums[upper] - self._nights_sums[lower]
+
+    def occupancy(self, first: int, last: int) -> float:
+        """Return the share of the nights booked from month `first` to month `last` included, between 0 and 1."""
+        days = (month_start(last + 1) - month_start(first)).days
+        return self.nights(first, last) / days if days > 0 else 0.0
+
+    def total_earnings(self) -> Decimal:
+        """Return the earnings of all the rentals."""
+        self._ensure_sums()
+        return self._earnings_sums[-1]
+
+    def yearly_earnings(self) -> dict[int, Decimal]:
+        """Return the earnings of the rentals, by year of check-in."""
+        self._ensure_sums()
+        years = range(self._first // 12, (self._first + len(self._earnings_sums) - 2) // 12 + 1)
+        return {year: self.earnings(year * 12, year * 12 + 11) for year in years}
+
+
+class BookingsAnalytics:
+    """Monthly totals of the rentals, per accommodation and for the whole account. Owner stays are not counted."""
+
+    __slots__ = ("_account", "_accommodations")
+
+    def __init__(self) -> None:
+        """Initialize empty analytics."""
+        self._account = MonthlyTotals()
+        self._accommodations: dict[str | None, MonthlyTotals] = {}
+
+    def add(self, booking: Booking) -> None:
+        """Count a booking in."""
+        self._update(booking, 1)
+
+    def remove(self, booking: Booking) -> None:
+        """Count a booking, previously added, out."""
+        self._update(booking, -1)
+
+    def _update(self, booking: Booking, sign: int) -> None:
+        if not booking.is_rental:
+            return
+        self._account.add(booking, sign)
+        totals = self._accommodations.get(booking.accommodation_id)
+        if totals is None:
+            totals = self._accommodations[booking.accommodation_id] = MonthlyTotals()
+        totals.add(booking, sign)
+
+    def clear(self) -> None:
+        """Forget all the bookings."""
+        self._account = MonthlyTotals()
+        self._accommodations.clear()
+
+    def get(self, accommodation_id=None) -> MonthlyTotals:
+        """Get the monthly totals of the given accommodation, or of the whole account when omitted."""
+        if accommodation_id is None:
+            return self._account
+        totals = self._accommodations.get(str(accommodation_id))
+        return totals if totals is not None else MonthlyTotals()
@@ -0,0 +1,169 @@
+"""Local stand-in of app.avantio.pro, serving synthetic accounts to benchmark the integration offline."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+import json
+import random
+import secrets
+
+from aiohttp import web
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+AGENTS = ["", "Airbnb", "Booking.com", "Abritel", "Direct"]
+STATUSES = ["PAID", "UNPAID", "CONFIRMADA", "BAJOPETICION", "PROPIETARIO"]
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html>
+<head><title>Avantio</title></head>
+<body>
+{padding}
+<form method="post" action="index.php" enctype="multipart/form-data">
+<input type="text" name="user_name">
+<input type="password" name="user_password">
+<input type="hidden" name="csrftoken" value="{token}">
+</form>
+{padding}
+</body>
+</html>
+"""
+
+
+def format_date(day: date) -> str:
+    """Format a date the way Avantio does, i.e. '%d %b %Y' in English."""
+    return f"{day.day:02d} {MONTHS[day.month - 1]} {day.year}"
+
+
+def generate_bookings(count: int, accommodations: int, seed: int = 0) -> list[dict]:
+    """Generate bookings rows, sorted from the most recent check-in to the oldest."""
+    rng = random.Random(seed)
+    today = date.today()
+    rows = []
+    for index in range(count):
+        # spread check-ins from 6 months ahead, back in time, ~3 bookings per accommodation and week
+        check_in = today + timedelta(days=180 - index * 7 // max(1, 3 * accommodations))
+        nights = rng.randint(1, 14)
+        status = rng.choice(STATUSES)
+        amount = 0 if status == "PROPIETARIO" else rng.randint(5000, 500000) / 100
+        rows.append(
+            {
+                "id": f"B{index:08d}",
+                "accommodation": {"id": rng.randrange(accommodations) + 1, "name": "Accommodation"},
+                "bookingStart": format_date(check_in),
+                "bookingEnd": format_date(check_in + timedelta(days=nights)),
+                "amount": f"{amount:,.2f}€",
+                "status": {"name": status},
+                "agent": {"name": rng.choice(AGENTS)},
+                "guests": {
+                    "numAdults": rng.randint(1, 4),
+                    "numChildren": rng.randint(0, 3),
+                    "numBabies": rng.randint(0, 1),
+                    "childrenAges": [rng.randint(0, 17) for _ in range(3)],
+                },
+            }
+        )
+    rows.sort(key=lambda row: row["id"])
+    return rows
+
+
+@dataclass
+class MockAvantio:
+    """Synthetic account served by the mock server, along with the counters of the requests it received."""
+
+    bookings: list[dict]
+    accommodations: list[dict]
+    # Delay, in seconds, added to every response
+    latency: float = 0.0
+    # Log the session out every given number of page requests, 0 to never do so
+    logout_every: int = 0
+    # Padding of the login page, in bytes, to simulate a real page weight
+    login_page_padding: int = 20_000
+    # Maximum number of items per page, whatever the requested limit, 0 for no maximum
+    page_cap: int = 0
+    requests: dict[str, int] = field(default_factory=dict)
+    _sessions: set[str] = field(default_factory=set)
+    _tokens: set[str] = field(default_factory=set)
+
+    @classmethod
+    def generate(cls, bookings: int, accommodations: int = 10, **kwargs) -> MockAvantio:
+        """Create a synthetic account with the given number of bookings and accommodations."""
+        return cls(
+            bookings=generate_bookings(bookings, accommodations),
+            accommodations=[
+                {"id": index + 1, "name": f"Accommodation {index + 1}"} for index in range(accommodations)
+            ],
+            **kwargs,
+        )
+
+    def add_booking(self, row: dict) -> None:
+        """Add a booking, as the most recent one."""
+        self.bookings.insert(0, row)
+
+    def reset_counters(self) -> None:
+        """Reset the counters of requests."""
+        self.requests.clear()
+
+    def _count(self, kind: str) -> None:
+        self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def app(self) -> web.Application:
+        """Create the aiohttp application serving the account."""
+        app = web.Application()
+        app.router.add_get("/index.php", self._handle_get)
+        app.router.add_post("/index.php", self._handle_post)
+        return app
+
+    async def _handle_get(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        if request.query.get("module") == "Home" and request.cookies.get("session") in self._sessions:
+            self._count("home")
+            return web.Response(text="<html><body>Home</body></html>", content_type="text/html")
+
+        self._count("login_page")
+        token = secrets.token_hex(16)
+        self._tokens.add(token)
+        padding = "<!--" + "x" * self.login_page_padding + "-->"
+        return web.Response(text=LOGIN_PAGE.format(token=token, padding=padding), content_type="text/html")
+
+    async def _handle_post(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        form = await request.post()
+
+        if form.get("action") == "Login":
+            self._count("login")
+            if form.get("csrftoken") not in self._tokens:
+                raise web.HTTPFound("/index.php?module=Usuarios&action=Login")
+            session = secrets.token_hex(16)
+            self._sessions.add(session)
+            response = web.HTTPFound("/index.php?module=Home&action=index")
+            response.set_cookie("session", session)
+            raise response
+
+        if request.cookies.get("session") not in self._sessions:
+            self._count("logged_out")
+            raise web.HTTPFound("/index.php?module=Usuarios&action=Login")
+
+        self._count("page")
+        if self.logout_every and self.requests["page"] % self.logout_every == 0:
+            self._sessions.discard(request.cookies.get("session"))
+
+        params = json.loads(form.get("params", "{}"))
+        offset = int(params.get("offset", 0))
+        limit = int(params.get("limit", 50))
+        if self.page_cap:
+            limit = min(limit, self.page_cap)
+        if form.get("functionName") == "fetchOwnerBookings":
+            data_path, items = "list", self.bookings
+        elif form.get("functionName") == "fetchAccommodations":
+            data_path, items = "accommodations", self.accommodations
+        else:
+            raise web.HTTPNotFound
+
+        return web.json_response(
+            {
+                data_path: items[offset:offset + limit],
+                "pagination": {"total": len(items), "hasNextPage": offset + limit < len(items)},
+            }
+        )
@@ -0,0 +1,210 @@
+"""Benchmark the Avantio client and coordinator against the local mock server.
+
+Requires Home Assistant and aiohttp to be installed. Run from the root of the repository:
+
+    python benchmarks/run.py --sizes 10 1000 10000 50000 --latency 0.05 --logout-every 0 --page-cap 0
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import timedelta
+import importlib.util
+import inspect
+from pathlib import Path
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import MappingProxyType
+
+import aiohttp
+from aiohttp.test_utils import TestServer
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from mock_server import MockAvantio, format_date
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_integration():
+    """Import the integration as the `avantio` package, whatever the name of the repository directory."""
+    spec = importlib.util.spec_from_file_location(
+        "avantio", ROOT / "__init__.py", submodule_search_locations=[str(ROOT)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["avantio"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def create_config_entry(domain: str) -> config_entries.ConfigEntry:
+    """Create a config entry, passing only the arguments supported by the installed Home Assistant version."""
+    arguments = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": domain,
+        "title": "benchmark",
+        "data": {},
+        "source": config_entries.SOURCE_USER,
+        "options": {},
+        "unique_id": None,
+        "discovery_keys": MappingProxyType({}),
+        "subentries_data": None,
+    }
+    supported = inspect.signature(config_entries.ConfigEntry).parameters
+    return config_entries.ConfigEntry(**{key: value for key, value in arguments.items() if key in supported})
+
+
+async def measure(results: list[dict], size: int, scenario: str, mock: MockAvantio, coroutine) -> None:
+    """Run a refresh, and record its wall time, request count and peak memory."""
+    mock.reset_counters()
+    tracemalloc.start()
+    started = time.perf_counter()
+    stages = await coroutine
+    wall_time = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    results.append(
+        {
+            "bookings": size,
+            "scenario": scenario,
+            "wall_time": wall_time,
+            "requests": sum(mock.requests.values()),
+            "peak_memory": peak,
+            **stages,
+        }
+    )
+
+
+async def run_size(args: argparse.Namespace, size: int, results: list[dict]) -> None:
+    """Benchmark all the scenarios for an account of the given number of bookings."""
+    avantio = sys.modules["avantio"]
+    from avantio.calendar import EventTimeline
+    from avantio.client import AvantioClient
+    from avantio.coordinator import AvantioCoordinator
+
+    mock = MockAvantio.generate(
+        bookings=size,
+        accommodations=args.accommodations,
+        latency=args.latency,
+        logout_every=args.logout_every,
+        page_cap=args.page_cap,
+    )
+    server = TestServer(mock.app())
+    await server.start_server()
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        if hasattr(hass.config, "async_set_time_zone"):
+            await hass.config.async_set_time_zone("Europe/Paris")
+        else:
+            hass.config.set_time_zone("Europe/Paris")
+
+        config_entries.current_entry.set(create_config_entry(avantio.DOMAIN))
+        # the default cookie jar ignores the cookies of IP addresses, such as the one of the mock server
+        session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True))
+        client = AvantioClient(
+            username="benchmark",
+            password="benchmark",
+            session=session,
+            base_url=str(server.make_url("")).rstrip("/"),
+        )
+        coordinator = AvantioCoordinator(hass, client)
+
+        async def refresh() -> dict:
+            await coordinator.async_refresh()
+            if not coordinator.last_update_success:
+                raise RuntimeError(f"Refresh failed: {coordinator.last_exception}")
+            if len(coordinator.get_bookings()) != len(mock.bookings):
+                raise RuntimeError(
+                    f"Refresh lost bookings: {len(coordinator.get_bookings())} out of {len(mock.bookings)}"
+                )
+            stats = coordinator.get_last_refresh()
+            return {
+                "page_time": stats.client.page_time,
+                "parse_time": stats.client.parse_time,
+                "processing_time": stats.processing_time,
+                "skipped": stats.skipped,
+            }
+
+        async def update_entities() -> dict:
+            # what calendars do on each coordinator update, plus one month view per calendar
+            started = time.process_time()
+            now = dt_util.now()
+            for accommodation in coordinator.get_accommodations():
+                for is_rental in (True, False):
+                    timeline = EventTimeline(coordinator.get_accommodation_bookings(accommodation["id"], is_rental))
+                    for booking in timeline.overlapping(now, now + timedelta(days=31)):
+                        booking.to_calendar_event()
+            return {"entity_time": time.process_time() - started}
+
+        await measure(results, size, "full refresh", mock, refresh())
+        await measure(results, size, "entity updates", mock, update_entities())
+        await measure(results, size, "unchanged refresh", mock, refresh())
+
+        check_in = dt_util.now().date() + timedelta(days=2)
+        mock.add_booking(
+            {
+                **mock.bookings[0],
+                "id": "B-new",
+                "bookingStart": format_date(check_in),
+                "bookingEnd": format_date(check_in + timedelta(days=7)),
+            }
+        )
+        await measure(results, size, "incremental refresh", mock, refresh())
+
+        await coordinator.async_shutdown()
+        await session.close()
+        await hass.async_stop(force=True)
+
+    await server.close()
+
+
+def print_results(results: list[dict]) -> None:
+    """Print the results as a table."""
+    columns = [
+        ("bookings", "bookings", 9, "d"),
+        ("scenario", "scenario", 20, ""),
+        ("wall_time", "wall (s)", 9, ".3f"),
+        ("requests", "requests", 8, "d"),
+        ("peak_memory", "peak (MiB)", 10, ".2f"),
+        ("page_time", "pages (s)", 9, ".3f"),
+        ("parse_time", "parse (s)", 9, ".3f"),
+        ("processing_time", "process (s)", 11, ".3f"),
+        ("entity_time", "entities (s)", 12, ".3f"),
+    ]
+    print("  ".join(f"{title:>{width}}" for _, title, width, _ in columns))
+    for result in results:
+        values = {**result, "peak_memory": result["peak_memory"] / 2**20}
+        print(
+            "  ".join(
+                f"{values[key]:>{width}{spec}}" if key in values else " " * width
+                for key, _, width, spec in columns
+            )
+        )
+
+
+def main() -> None:
+    """Parse the arguments, and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000, 50000])
+    parser.add_argument("--accommodations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="delay added to each response, in seconds")
+    parser.add_argument("--logout-every", type=int, default=0, help="force a logout every N page requests")
+    parser.add_argument("--page-cap", type=int, default=0, help="serve at most N items per page, 0 for no cap")
+    args = parser.parse_args()
+
+    load_integration()
+    results: list[dict] = []
+    for size in args.sizes:
+        asyncio.run(run_size(args, size, results))
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
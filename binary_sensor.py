@@ -0,0 +1,132 @@
+"""Add binary sensor entities for a given HomeAssistant ConfigEntry."""
+
+from collections.abc import Callable
+from datetime import date, datetime
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import AvantioCoordinator
+from .occupancy import CHECK_IN, CHECK_OUT, OWNER, RENTAL, DayOccupancy
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor platform from a config entry."""
+    coordinator: AvantioCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities = []
+    for accommodation in coordinator.get_accommodations():
+        entities.extend(
+            [
+                OccupancyBinarySensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_occupied_today",
+                    translation_key="occupied_today",
+                    is_on_fn=DayOccupancy.is_occupied,
+                    device_class=BinarySensorDeviceClass.OCCUPANCY,
+                ),
+                OccupancyBinarySensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_changeover_today",
+                    translation_key="changeover_today",
+                    is_on_fn=DayOccupancy.is_changeover,
+                    icon="mdi:broom",
+                ),
+            ]
+        )
+
+    async_add_entities(entities)
+
+
+class OccupancyBinarySensor(CoordinatorEntity, BinarySensorEntity):
+    """Representation of a Binary Sensor that shows the occupancy of an accommodation today."""
+
+    coordinator: AvantioCoordinator
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: AvantioCoordinator,
+        accommodation_id,
+        unique_id: str,
+        translation_key: str,
+        is_on_fn: Callable[[DayOccupancy, date], bool],
+        device_class: BinarySensorDeviceClass | None = None,
+        icon: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_id = f"{Platform.BINARY_SENSOR}.{DOMAIN}_{unique_id}"
+        self._attr_unique_id = unique_id
+        self._attr_translation_key = translation_key
+        self._attr_device_class = device_class
+        self._attr_icon = icon
+        self._accommodation_id = accommodation_id
+        self._is_on_fn = is_on_fn
+        self._state = None
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the state, and update it at the start of each day."""
+        await super().async_added_to_hass()
+        self._update_state()
+        self.async_on_remove(
+            async_track_time_change(self.hass, self._handle_midnight, hour=0, minute=0, second=0)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, if the state or the availability changed."""
+        if self._update_state():
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_midnight(self, now: datetime) -> None:
+        """Update the state for the new day."""
+        if self._update_state():
+            self.async_write_ha_state()
+
+    def _update_state(self) -> bool:
+        """Look today up in the occupancy of the accommodation.
+
+        Returns whether the state, or the availability, changed since it was last written.
+        """
+        today = dt_util.now().date()
+        occupancy = self.coordinator.get_occupancy(self._accommodation_id)
+        flags = occupancy.flags(today)
+        state = (
+            self._is_on_fn(occupancy, today),
+            {
+                "rental": bool(flags & RENTAL),
+                "owner": bool(flags & OWNER),
+                "check_in": bool(flags & CHECK_IN),
+                "check_out": bool(flags & CHECK_OUT),
+            },
+            self.available,
+        )
+        if state == self._state:
+            return False
+        self._state = state
+        return True
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return the state of the sensor."""
+        return self._state[0] if self._state is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, i.e. who occupies the accommodation tonight, and who checks in or out."""
+        return self._state[1] if self._state is not None else None
@@ -1,17 +1,21 @@
 """Add calendar entities for a given HomeAssistant ConfigEntry."""
 
+from bisect import bisect_left, bisect_right
 import datetime
-from zoneinfo import ZoneInfo
+from itertools import accumulate
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import AvantioCoordinator
+from .models import Booking
 
 
 async def async_setup_entry(
@@ -22,12 +26,14 @@ async def async_setup_entry(
     """Set up the calendar platform from a config entry."""
     coordinator: AvantioCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    entities = []
     for accommodation in coordinator.get_accommodations():
-        async_add_entities(
+        entities.extend(
             [
                 BookingCalendar(
                     translation_key="rental",
                     coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
                     unique_id=f"{accommodation['id']}_rental",
                     icon="mdi:calendar-check-outline",
                     for_rental=True,
@@ -35,14 +41,44 @@ async def async_setup_entry(
                 BookingCalendar(
                     translation_key="owner",
                     coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
                     unique_id=f"{accommodation['id']}_owner",
                     icon="mdi:calendar-account-outline",
                     for_rental=False,
                 ),
-            ],
-            True,
+            ]
         )
 
+    async_add_entities(entities)
+
+
+class EventTimeline:
+    """Bookings sorted by start, indexed to quickly find the ones overlapping a time range."""
+
+    def __init__(self, events: list[Booking] | None = None) -> None:
+        """Sort the bookings, and compute the running maximum of their end."""
+        self.events: list[Booking] = sorted(events or [], key=lambda event: event.start)
+        self._starts = [event.start for event in self.events]
+        # Non-decreasing, hence searchable: events before the first index ending after a date all end before it
+        self._max_ends = list(accumulate((event.end for event in self.events), max))
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self.events)
+
+    def overlapping(
+        self, start_date: datetime.datetime, end_date: datetime.datetime
+    ) -> list[Booking]:
+        """Return the bookings overlapping the given time range, sorted by start."""
+        first = bisect_right(self._max_ends, start_date)
+        last = bisect_left(self._starts, end_date)
+        return [event for event in self.events[first:last] if event.end > start_date]
+
+    def first_ending_after(self, when: datetime.datetime) -> Booking | None:
+        """Return the earliest starting booking that is not over at the given time, i.e. ongoing or upcoming."""
+        index = bisect_right(self._max_ends, when)
+        return self.events[index] if index < len(self.events) else None
+
 
 class BookingCalendar(CoordinatorEntity[AvantioCoordinator], CalendarEntity):
     """BookingCalendar is a class that represents a calendar entity for booking events."""
@@ -53,6 +89,7 @@ class BookingCalendar(CoordinatorEntity[AvantioCoordinator], CalendarEntity):
         self,
         translation_key: str,
         coordinator: AvantioCoordinator,
+        accommodation_id: str,
         unique_id: str | None = None,
         icon: str | None = None,
         for_rental: bool = True,
@@ -64,37 +101,88 @@ class BookingCalendar(CoordinatorEntity[AvantioCoordinator], CalendarEntity):
             self._attr_unique_id = unique_id
         self._attr_translation_key = translation_key
         self._attr_icon = icon
-        self._events: list[CalendarEvent] = []
+        self._events = EventTimeline()
+        self._events_hash: int | None = None
+        self._available: bool | None = None
         self._event: CalendarEvent | None = None
+        self._unsub_boundary: CALLBACK_TYPE | None = None
+        self._accommodation_id = accommodation_id
         self._for_rental = for_rental
 
+    async def async_added_to_hass(self) -> None:
+        """Load the events already fetched by the coordinator, when added to hass."""
+        await super().async_added_to_hass()
+        self._available = self.available
+        self._update_events()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the scheduled event boundary, when removed from hass."""
+        await super().async_will_remove_from_hass()
+        self._cancel_boundary()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._events = [
-            CalendarEvent(**{k: v for k, v in event_data.items() if k != "is_rental"})
-            for event_data in self.coordinator.get_bookings()
-            if event_data["is_rental"] is self._for_rental
-        ]
+        """Handle updated data from the coordinator, if the bookings of this calendar or its availability changed."""
+        events_hash = self.coordinator.get_accommodation_bookings_hash(self._accommodation_id, self._for_rental)
+        if (events_hash, self.available) == (self._events_hash, self._available):
+            return
+        self._available = self.available
+        if events_hash != self._events_hash:
+            self._update_events()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_events(self) -> None:
+        """Rebuild the events from the coordinator data."""
+        self._events_hash = self.coordinator.get_accommodation_bookings_hash(
+            self._accommodation_id, self._for_rental
+        )
+        self._events = EventTimeline(
+            self.coordinator.get_accommodation_bookings(self._accommodation_id, self._for_rental)
+        )
+        self._update_next_event()
+
+    @callback
+    def _update_next_event(self) -> None:
+        """Point to the ongoing or upcoming event, and schedule the next update at its start or end."""
+        self._cancel_boundary()
+        now = dt_util.now()
+        booking = self._events.first_ending_after(now)
+        # only the pointed booking is rendered as an event ahead of time, others are when requested
+        self._event = booking.to_calendar_event() if booking is not None else None
+        if booking is not None:
+            boundary = booking.start if booking.start > now else booking.end
+            self._unsub_boundary = async_track_point_in_time(
+                self.hass, self._handle_boundary, boundary
+            )
+
+    @callback
+    def _handle_boundary(self, now: datetime.datetime) -> None:
+        """Handle the start or end of the pointed event."""
+        self._unsub_boundary = None
+        self._update_next_event()
         self.async_write_ha_state()
 
+    @callback
+    def _cancel_boundary(self) -> None:
+        """Cancel the scheduled update at the next event boundary, if any."""
+        if self._unsub_boundary is not None:
+            self._unsub_boundary()
+            self._unsub_boundary = None
+
     async def async_get_events(
         self,
         hass: HomeAssistant,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
     ) -> list[CalendarEvent]:
-        """Return the full list of events."""
-        return self._events
+        """Return the events overlapping the given time range."""
+        return [
+            booking.to_calendar_event()
+            for booking in self._events.overlapping(start_date, end_date)
+        ]
 
     @property
     def event(self) -> CalendarEvent | None:
-        """Return the next upcoming event."""
-        if not self._events:
-            return None
-
-        now = datetime.datetime.now(ZoneInfo(self.coordinator.hass.config.time_zone))
-        upcoming_events = [event for event in self._events if event.start > now]
-        upcoming_events.sort(key=lambda event: event.start)
-
-        return upcoming_events[0] if upcoming_events else None
+        """Return the ongoing or next upcoming event."""
+        return self._event
@@ -1,26 +1,166 @@
 """Unofficial client to Avantio, which reverse-engineer the API calls of the platform app.avantio.com."""
 
 import aiohttp
+import asyncio
+import hashlib
 import json
 import logging
-from bs4 import BeautifulSoup
+import random
+import re
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass
 from homeassistant.exceptions import HomeAssistantError
 
 # Create a logger instance
 _LOGGER = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
+# Base delay, in seconds, of the exponential backoff between retries, and its upper bound
+RETRY_BACKOFF = 1.0
+RETRY_BACKOFF_MAX = 30.0
+# Timeout, in seconds, of each page request
+PAGE_TIMEOUT = 30
+PAGINATION_CONCURRENCY = 4
+
+# Page size of each endpoint, tuned from the duration and weight of its pages, and its bounds
+DEFAULT_PAGE_SIZE = 50
+MIN_PAGE_SIZE = 25
+MAX_PAGE_SIZE = 1000
+# Full pages faster than this make the page size grow, pages slower or heavier than this make it shrink
+FAST_PAGE_TIME = 2.0
+SLOW_PAGE_TIME = 10.0
+MAX_PAGE_BYTES = 4 * 2 ** 20
+
+CSRF_TOKEN_CHUNK_SIZE = 4096
+CSRF_TOKEN_INPUT_PATTERN = re.compile(rb"<input[^>]*name=[\"']csrftoken[\"'][^>]*>", re.IGNORECASE)
+CSRF_TOKEN_VALUE_PATTERN = re.compile(rb"value=[\"']([^\"']*)[\"']", re.IGNORECASE)
+
+BOOKINGS_REQUEST = {
+    "module": "Compromisos",
+    "action": "Ajax",
+    "functionName": "fetchOwnerBookings",
+    "params": '{"dateCheckType":"CHECKIN","sort":"RECENT_TO_OLDEST_CHECKIN","status":["UNPAID","CONFIRMADA","BAJOPETICION","PROPIETARIO","PAID"]}',
+}
+ACCOMMODATIONS_REQUEST = {
+    "module": "PlanningPropietarios",
+    "action": "Ajax",
+    "functionName": "fetchAccommodations"
+}
+
+
+@dataclass(slots=True)
+class ClientStats:
+    """Counters of the requests made by a client, and of the time they took, in seconds."""
+
+    requests: int = 0
+    pages: int = 0
+    logins: int = 0
+    relogins: int = 0
+    retries: int = 0
+    bytes_received: int = 0
+    login_time: float = 0.0
+    page_time: float = 0.0
+    max_page_time: float = 0.0
+    parse_time: float = 0.0
+
+    def record_page(self, duration: float, size: int) -> None:
+        """Record a page received after the given duration, with a body of the given size in bytes."""
+        self.pages += 1
+        self.bytes_received += size
+        self.page_time += duration
+        self.max_page_time = max(self.max_page_time, duration)
+
+
+@dataclass(slots=True)
+class PageSize:
+    """Page size of an endpoint, doubled while its pages are fast and light, halved on slow or heavy pages.
+
+    The size never grows beyond the number of items the server returned for a page that was not the last one, as
+    that is the maximum page size it serves.
+    """
+
+    size: int = DEFAULT_PAGE_SIZE
+    cap: int = MAX_PAGE_SIZE
+
+    def record(self, limit: int, count: int, has_next: bool, duration: float, size: int) -> None:
+        """Record a page requested with the given limit, holding `count` items, followed by others if `has_next`,
+        received after the given duration with a body of the given size in bytes.
+
+        Pages fetched concurrently are recorded in any order, hence the new size is derived from their limit rather
+        than from the current size.
+        """
+        if count < limit and has_next:
+            # the server capped the page
+            self.cap = min(self.cap, max(MIN_PAGE_SIZE, count))
+            self.size = min(self.size, self.cap)
+        if duration > SLOW_PAGE_TIME or size > MAX_PAGE_BYTES:
+            self.shrink(limit)
+        elif count >= limit and duration < FAST_PAGE_TIME and size < MAX_PAGE_BYTES // 2:
+            # only full pages tell whether a bigger one would be fast enough
+            self.size = max(self.size, min(self.cap, limit * 2))
+
+    def shrink(self, limit: int) -> None:
+        """Halve the size of pages, after a page requested with the given limit was too slow or too heavy."""
+        self.size = min(self.size, max(MIN_PAGE_SIZE, limit // 2))
+
+
+class RequestLimiter:
+    """Limit the number of concurrent requests, and their rate, across all the clients sharing it."""
+
+    def __init__(self, max_concurrent: int, max_per_second: float) -> None:
+        """Initialise the limiter. A `max_per_second` of 0 disables the rate limit."""
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._interval = 1 / max_per_second if max_per_second > 0 else 0
+        self._next_slot = 0.0
+
+    async def __aenter__(self) -> None:
+        """Wait for a free request slot."""
+        await self._semaphore.acquire()
+        try:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Release the request slot."""
+        self._semaphore.release()
 
 
 class AvantioClient:
     """Utility class to communicate with avantio "API"."""
 
     def __init__(
-            self, username: str, password: str, base_url: str = "https://app.avantio.pro"
+            self,
+            username: str,
+            password: str,
+            session: aiohttp.ClientSession | None = None,
+            base_url: str = "https://app.avantio.pro",
+            limiter: RequestLimiter | None = None,
     ) -> None:
-        """Initialise the client."""
+        """Initialise the client.
+
+        session: dedicated session holding the cookies of this account. The client takes ownership of it and closes
+        it in `close()`. When omitted, a standalone session is created on first use.
+        limiter: limiter every request goes through, which can be shared with the clients of other accounts.
+        """
         self._username = username
         self._password = password
+        self._session = session
+        self._limiter: AbstractAsyncContextManager = limiter if limiter is not None else nullcontext()
+        self.stats = ClientStats()
+        # Tuned page size of each endpoint, by function name, kept across paginations
+        self._page_sizes: dict[str, PageSize] = {}
+        self._signed_in = False
+        # Incremented on each successful sign in, so concurrent requests logged-out together only sign in once
+        self._sign_in_generation = 0
+        self._sign_in_lock = asyncio.Lock()
         self._base_url = base_url
         self._login_url = f"{self._base_url}/index.php"
         self._base_headers = {
@@ -34,20 +174,73 @@ class AvantioClient:
             "Origin": " ",
         }
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the long-lived session of this client, creating it if needed."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self._base_headers)
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying session, dropping its cookies."""
+        self._signed_in = False
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def username(self) -> str:
+        """Return the username of the account."""
+        return self._username
+
+    def has_credentials(self, username: str, password: str) -> bool:
+        """Return whether the client signs in with the given credentials."""
+        return (self._username, self._password) == (username, password)
+
+    async def change_credentials(self, username: str, password: str) -> bool:
+        """Sign in with other credentials, e.g. after a password change, keeping the session and the tuned state.
+
+        The current credentials are kept if the new ones are rejected, in which case `InvalidAuth` is raised.
+        """
+        previous = (self._username, self._password)
+        self._username, self._password = username, password
+        try:
+            async with self._sign_in_lock:
+                return await self.sign_in()
+        except BaseException:
+            self._username, self._password = previous
+            raise
+
+    @property
+    def page_sizes(self) -> dict[str, int]:
+        """Return the tuned page size of each endpoint, by function name."""
+        return {endpoint: page_size.size for endpoint, page_size in self._page_sizes.items()}
+
+    def restore_page_sizes(self, page_sizes: dict[str, int]) -> None:
+        """Restore page sizes previously returned by `page_sizes`, e.g. before a restart."""
+        for endpoint, size in page_sizes.items():
+            self._page_sizes[endpoint] = PageSize(min(MAX_PAGE_SIZE, max(MIN_PAGE_SIZE, int(size))))
+
     def is_logged_out(self, response_url) -> bool:
         return True if "action=Login" in str(response_url) else False
 
-    async def sign_in(self, session) -> bool:
+    async def ensure_signed_in(self) -> bool:
+        """Sign in only if the session does not already carry a valid login."""
+        async with self._sign_in_lock:
+            if self._signed_in:
+                return True
+            return await self.sign_in()
+
+    async def sign_in(self) -> bool:
         """Sign in a user and store cookies into the embedded session."""
         _LOGGER.debug("Signing in to %s", self._base_url)
-        async with session.get(self._login_url) as init_response:
-            soup = BeautifulSoup(await init_response.text(), features="html.parser")
-            tag = soup.find(
-                "input", attrs={"name": "csrftoken", "type": "hidden"}
-            )
-            if tag is None or tag["value"] is None:
+        session = self._get_session()
+        self._signed_in = False
+        self.stats.logins += 1
+        started = time.monotonic()
+        async with self._limiter, session.get(self._login_url, headers=self._base_headers) as init_response:
+            csrftoken = await _read_csrf_token(init_response)
+            if csrftoken is None:
                 raise Exception("Could not find CSRF token on login page")
-            csrftoken = tag["value"]
 
         login_data = {
             "module": "Usuarios",
@@ -66,11 +259,14 @@ class AvantioClient:
             for key, value in login_data.items():
                 part = mp.append(value)
                 part.set_content_disposition("form-data", name=key)
-            async with session.post(
+            async with self._limiter, session.post(
                     f"{self._base_url}/index.php", data=mp, headers=self._base_headers
             ) as login_response:
                 if "module=Home" in str(login_response.url):
                     _LOGGER.info("Successfully logged to %s", self._base_url)
+                    self._signed_in = True
+                    self._sign_in_generation += 1
+                    self.stats.login_time += time.monotonic() - started
                     return True
 
                 _LOGGER.info("Failed to logged to %s", self._base_url)
@@ -79,30 +275,145 @@ class AvantioClient:
         _LOGGER.info("Failed to logged to %s", self._base_url)
         return False
 
-    async def pagination(self, session, booking_data: dict, data_path: str = "list", max_items: int = 50,
-                         retries: int = 0) -> list | None:
-        """Paginate an Avantio Ajax endpoint.
+    async def _fetch_page(self, booking_data: dict, params_obj: dict, offset: int, limit: int,
+                          data_path: str, page_size: PageSize | None = None) -> tuple[list, dict] | None:
+        """Fetch a single page of an Avantio Ajax endpoint.
 
-        booking_data: dict containing keys like `module`, `action`, `functionName`, and `params` (JSON string).
-        data_path: dot-separated path to the items in the JSON response (default: "list").
-
-        Returns the aggregated list of items or None on failure.
+        Returns the items found at `data_path` along with the `pagination` block, or None on failure. The rest of
+        the decoded document is released as soon as the page is returned. The page is recorded into `page_size`, if
+        any.
+        Raises `LoggedOut` if Avantio redirected to the login page, and `TransientError` on server errors.
         """
-        if await self.sign_in(session) is False:
-            _LOGGER.error("Failed to paginate: not signed in")
-            return None
+        page_data = {**booking_data, "params": json.dumps({**params_obj, "offset": offset, "limit": limit})}
+        self.stats.requests += 1
+        started = time.monotonic()
+
+        with aiohttp.MultipartWriter("form-data") as mp:
+            for key, value in page_data.items():
+                part = mp.append(value)
+                part.set_content_disposition("form-data", name=key)
+            async with self._limiter, self._get_session().post(
+                    f"{self._base_url}/index.php",
+                    data=mp,
+                    headers=self._base_headers,
+                    timeout=aiohttp.ClientTimeout(total=PAGE_TIMEOUT),
+            ) as response:
+                if self.is_logged_out(response.url):
+                    raise LoggedOut
+
+                if response.status >= 500:
+                    raise TransientError(f"unexpected response status {response.status}")
+
+                if response.status != 200:
+                    _LOGGER.error(
+                        "Failed to paginate: unexpected response status %s",
+                        response.status,
+                    )
+                    if response.status == 403:
+                        raise InvalidAuth
+                    return None
 
-        def _extract_path(obj: dict, path: str):
-            if not path:
-                return obj
-            cur = obj
-            for part in path.split("."):
-                if not isinstance(cur, dict):
+                body = await response.read()
+                duration = time.monotonic() - started
+                self.stats.record_page(duration, len(body))
+                parse_started = time.monotonic()
+                try:
+                    # decode straight from the raw bytes, without an intermediate text copy
+                    data = json.loads(body)
+                except Exception:
+                    _LOGGER.error("Failed to decode paginated JSON response")
                     return None
-                cur = cur.get(part)
-                if cur is None:
+
+                items = _extract_path(data, data_path) or []
+                self.stats.parse_time += time.monotonic() - parse_started
+                if not isinstance(items, list):
+                    _LOGGER.error("Paginated data at path %s is not a list", data_path)
                     return None
-            return cur
+
+                pagination_obj = data.get("pagination") or {}
+                if page_size is not None:
+                    page_size.record(
+                        limit, len(items), bool(pagination_obj.get("hasNextPage", False)), duration, len(body)
+                    )
+                return items, pagination_obj
+
+    async def _sign_in_again(self, generation: int) -> None:
+        """Sign in again after being logged-out, unless another request already did since the given generation."""
+        async with self._sign_in_lock:
+            if generation == self._sign_in_generation:
+                self.stats.relogins += 1
+                await self.sign_in()
+
+    async def _fetch_page_signed_in(self, booking_data: dict, params_obj: dict, offset: int, limit: int,
+                                    data_path: str, page_size: PageSize | None = None) -> tuple[list, dict]:
+        """Fetch a single page, retrying it up to MAX_RETRIES times.
+
+        The page is retried after signing in again whenever logged-out, and after an exponential backoff with jitter
+        on server errors, timeouts and connection errors. Pages already fetched by the caller are kept. Timeouts
+        shrink `page_size`, if any, for the pages requested next.
+
+        Raises `CannotConnect` on failure.
+        """
+        retry = 0
+        while True:
+            generation = self._sign_in_generation
+            try:
+                page = await self._fetch_page(booking_data, params_obj, offset, limit, data_path, page_size)
+            except LoggedOut:
+                if retry == MAX_RETRIES:
+                    raise CannotConnect(f"logged-out of avantio after {MAX_RETRIES} retries")
+                retry += 1
+                self.stats.retries += 1
+                _LOGGER.warning(
+                    f"Logged-out of avantio. Signing in again and retrying page at offset {offset} "
+                    f"(retry #{retry})...")
+                await asyncio.sleep(_backoff_delay(retry - 1))
+                await self._sign_in_again(generation)
+                continue
+            except (TransientError, asyncio.TimeoutError, aiohttp.ClientConnectionError) as err:
+                if isinstance(err, asyncio.TimeoutError) and page_size is not None:
+                    page_size.shrink(limit)
+                if retry == MAX_RETRIES:
+                    raise CannotConnect(f"failed to fetch page at offset {offset}: {err!r}") from err
+                retry += 1
+                self.stats.retries += 1
+                delay = _backoff_delay(retry)
+                _LOGGER.warning(
+                    f"Failed to fetch page at offset {offset} ({err!r}). Retrying in {delay:.1f}s "
+                    f"(retry #{retry})...")
+                await asyncio.sleep(delay)
+                continue
+
+            if page is None:
+                raise CannotConnect(f"failed to fetch page at offset {offset}")
+            return page
+
+    async def iter_pages(self, booking_data: dict, data_path: str = "list", max_items: int | None = None,
+                         concurrency: int = PAGINATION_CONCURRENCY,
+                         stop_when: Callable[[list], bool] | None = None,
+                         on_first_page: Callable[[list, dict], None] | None = None) -> AsyncIterator[list]:
+        """Paginate an Avantio Ajax endpoint, yielding the items of each page, in order.
+
+        booking_data: dict containing keys like `module`, `action`, `functionName`, and `params` (JSON string).
+        data_path: dot-separated path to the items in the JSON response (default: "list").
+        max_items: fixed size of pages. When omitted, and `params` has no `limit` either, the size of pages is tuned
+        for the endpoint as pages arrive: it grows while pages are fast and light, and shrinks on timeouts, slow or
+        heavy pages. The tuned size is kept for the next paginations of the endpoint.
+        concurrency: maximum number of pages fetched at once. When the first page reports a `pagination.total`
+        beyond itself, the remaining pages are requested concurrently, while the caller processes the yielded ones.
+        They are requested with as many items as the first page held, since the server may serve fewer items than
+        requested. Use 1 to walk pages one at a time.
+        stop_when: predicate called with the items of each page; pagination stops early once it returns True.
+        Pages are then always walked one at a time.
+        on_first_page: called with the items and the pagination block of the first page, before it is yielded.
+
+        The session is only signed in when it is not already, or when Avantio redirects to the login page, in which
+        case only the failing page is requested again.
+
+        Raises `CannotConnect` on failure.
+        """
+        if await self.ensure_signed_in() is False:
+            raise CannotConnect("not signed in")
 
         # parse initial params
         try:
@@ -111,85 +422,233 @@ class AvantioClient:
             params_obj = {}
 
         offset = int(params_obj.get("offset", 0))
-        limit = int(params_obj.get("limit", max_items))
+        page_size = None
+        if "limit" in params_obj:
+            limit = int(params_obj["limit"])
+        elif max_items is not None:
+            limit = max_items
+        else:
+            page_size = self._page_sizes.setdefault(booking_data.get("functionName", ""), PageSize())
+            limit = page_size.size
+
+        items, pagination_obj = await self._fetch_page_signed_in(booking_data, params_obj, offset, limit, data_path,
+                                                                  page_size)
+        if on_first_page is not None:
+            on_first_page(items, pagination_obj)
+        yield items
+        has_next = bool(pagination_obj.get("hasNextPage", False))
+        total = int(pagination_obj.get("total", 0))
+        if stop_when is not None:
+            concurrency = 1
+            has_next = has_next and not stop_when(items)
+
+        if has_next and concurrency > 1 and len(items) > 0 and total > offset + len(items):
+            # `total` is the size of the whole collection: fan out all remaining windows at once, each as big as the
+            # first page, which is known to be served in full
+            offset += len(items)
+            limit = len(items)
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def _bounded_fetch(window_offset: int) -> tuple[list, dict]:
+                async with semaphore:
+                    return await self._fetch_page_signed_in(booking_data, params_obj, window_offset, limit,
+                                                            data_path, page_size)
+
+            tasks = [
+                asyncio.create_task(_bounded_fetch(window_offset))
+                for window_offset in range(offset, total, limit)
+            ]
+            try:
+                for index, task in enumerate(tasks):
+                    items, _ = await task
+                    if len(items) < limit and index < len(tasks) - 1:
+                        # yielding the next windows would leave a hole, making the caller drop bookings
+                        raise CannotConnect(
+                            f"page at offset {offset + index * limit} held {len(items)} items out of {limit}"
+                        )
+                    yield items
+            finally:
+                for task in tasks:
+                    if not task.cancel() and not task.cancelled():
+                        # retrieve the exception of pages that failed while not awaited
+                        task.exception()
+            return
+
+        while has_next and len(items) > 0:
+            # the next page starts right after the items received so far. That is `total` if it counts the items up
+            # to this page, as it was used before, and also holds if it is the size of the whole collection
+            offset += len(items)
+            if page_size is not None:
+                limit = page_size.size
+            items, pagination_obj = await self._fetch_page_signed_in(booking_data, params_obj, offset, limit,
+                                                                      data_path, page_size)
+            yield items
+            has_next = bool(pagination_obj.get("hasNextPage", False))
+            if stop_when is not None:
+                has_next = has_next and not stop_when(items)
+
+    async def pagination(self, booking_data: dict, data_path: str = "list", max_items: int | None = None,
+                         concurrency: int = PAGINATION_CONCURRENCY,
+                         stop_when: Callable[[list], bool] | None = None) -> list | None:
+        """Paginate an Avantio Ajax endpoint.
+
+        See `iter_pages` for the arguments.
+
+        Returns the aggregated list of items or None on failure.
+        """
         results: list = []
+        try:
+            async for items in self.iter_pages(booking_data=booking_data, data_path=data_path, max_items=max_items,
+                                               concurrency=concurrency, stop_when=stop_when):
+                results.extend(items)
+        except CannotConnect as err:
+            _LOGGER.error("Failed to paginate: %s", err)
+            return None
 
-        has_next = True
-
-        while has_next:
-            params_obj["offset"] = offset
-            params_obj["limit"] = limit
-            booking_data["params"] = json.dumps(params_obj)
-
-            with aiohttp.MultipartWriter("form-data") as mp:
-                for key, value in booking_data.items():
-                    part = mp.append(value)
-                    part.set_content_disposition("form-data", name=key)
-                async with session.post(
-                        f"{self._base_url}/index.php",
-                        data=mp,
-                ) as response:
-                    if self.is_logged_out(response.url) and retries < MAX_RETRIES:
-                        _LOGGER.warning(
-                            f"Logged-out of avantio. Closing session and retrying (retry #{retries + 1})...")
-                        return await self.pagination(session=session, booking_data=booking_data, data_path=data_path,
-                                                     max_items=max_items, retries=retries + 1)
-
-                    if response.status != 200:
-                        _LOGGER.error(
-                            "Failed to paginate: unexpected response status %s",
-                            response.status,
-                        )
-                        if response.status == 403:
-                            raise InvalidAuth
-                        return None
-
-                    text = await response.text()
-                    try:
-                        data = json.loads(text)
-                    except Exception:
-                        _LOGGER.error("Failed to decode paginated JSON response")
-                        return None
-
-                    items = _extract_path(data, data_path) or []
-                    if not isinstance(items, list):
-                        _LOGGER.error("Paginated data at path %s is not a list", data_path)
-                        return None
-
-                    results.extend(items)
-
-                    pagination_obj = data.get("pagination")
-                    has_next = False if not pagination_obj else bool(pagination_obj.get("hasNextPage", False))
-                    # use total as next offset per request
-                    offset = int(pagination_obj.get("total", 0))
-
-        # unreachable
         return results
 
-    async def get_bookings(self):
-        _LOGGER.debug("Fetching bookings from %s", self._base_url)
-        booking_data = {
-            "module": "Compromisos",
-            "action": "Ajax",
-            "functionName": "fetchOwnerBookings",
-            "params": '{"dateCheckType":"CHECKIN","sort":"RECENT_TO_OLDEST_CHECKIN","status":["UNPAID","CONFIRMADA","BAJOPETICION","PROPIETARIO","PAID"]}',
-        }
+    async def probe_bookings(self) -> str:
+        """Fetch a fingerprint of the most recent bookings, changing whenever one of them is added, edited or removed.
 
-        async with aiohttp.ClientSession(headers=self._base_headers) as session:
-            # use shared pagination helper to aggregate all pages
-            return await self.pagination(session=session, booking_data=booking_data, data_path="list")
+        Only the first page of bookings is fetched, i.e. the DEFAULT_PAGE_SIZE latest check-ins, along with the
+        pagination block, so this is much cheaper than `get_bookings`. Whatever `total` means, any change among those
+        bookings changes the fingerprint; changes on older bookings do not. Raises `CannotConnect` on failure.
+        """
+        _LOGGER.debug("Probing bookings from %s", self._base_url)
+        if await self.ensure_signed_in() is False:
+            raise CannotConnect("not signed in")
+
+        items, pagination_obj = await self._fetch_page_signed_in(
+            BOOKINGS_REQUEST, json.loads(BOOKINGS_REQUEST["params"]), 0, DEFAULT_PAGE_SIZE, "list"
+        )
+        return _fingerprint_bookings(items, pagination_obj.get("total"))
+
+    def iter_bookings(self, stop_when: Callable[[list], bool] | None = None,
+                      on_fingerprint: Callable[[str | None], None] | None = None) -> AsyncIterator[list]:
+        """Fetch bookings page by page, from the most recent check-in to the oldest.
+
+        stop_when: see `iter_pages`, allows to only fetch the most recent bookings.
+        on_fingerprint: called with the fingerprint `probe_bookings` would return, computed from the first page
+        instead of requesting it again, or with None when that page cannot tell.
+        """
+        _LOGGER.debug("Fetching bookings from %s", self._base_url)
+        return self.iter_pages(
+            booking_data=BOOKINGS_REQUEST,
+            data_path="list",
+            stop_when=stop_when,
+            on_first_page=None
+            if on_fingerprint is None
+            else lambda items, pagination_obj: on_fingerprint(_probe_fingerprint(items, pagination_obj)),
+        )
+
+    async def get_bookings(self, stop_when: Callable[[list], bool] | None = None):
+        """Fetch bookings, from the most recent check-in to the oldest.
+
+        stop_when: see `iter_pages`, allows to only fetch the most recent bookings.
+        """
+        _LOGGER.debug("Fetching bookings from %s", self._base_url)
+        # use shared pagination helper to aggregate all pages
+        return await self.pagination(booking_data=BOOKINGS_REQUEST, data_path="list", stop_when=stop_when)
 
     async def get_accommodations(self):
         _LOGGER.debug("Fetching accommodations from %s", self._base_url)
-        booking_data = {
-            "module": "PlanningPropietarios",
-            "action": "Ajax",
-            "functionName": "fetchAccommodations"
-        }
+        # use shared pagination helper to aggregate all pages
+        return await self.pagination(booking_data=ACCOMMODATIONS_REQUEST, data_path="accommodations")
+
+
+async def _read_csrf_token(response: aiohttp.ClientResponse) -> str | None:
+    """Read the login page until its hidden `csrftoken` input is found, and return its value.
+
+    The page is searched as it is downloaded, and the rest of it is not read once the token is found. The page is
+    only parsed as HTML if the token could not be found that way.
+    """
+    page = bytearray()
+    async for chunk in response.content.iter_chunked(CSRF_TOKEN_CHUNK_SIZE):
+        # look back a bit, in case the input is split between chunks
+        start = max(0, len(page) - CSRF_TOKEN_CHUNK_SIZE)
+        page.extend(chunk)
+        match = CSRF_TOKEN_INPUT_PATTERN.search(page, start)
+        if match is not None:
+            value = CSRF_TOKEN_VALUE_PATTERN.search(match.group(0))
+            if value is not None:
+                return value.group(1).decode("utf-8", errors="replace")
+            break
+
+    return _parse_csrf_token(page.decode("utf-8", errors="replace"))
+
+
+def _parse_csrf_token(page: str) -> str | None:
+    """Parse the login page as HTML to find the value of its hidden `csrftoken` input."""
+    from html.parser import HTMLParser
+
+    class CsrfTokenParser(HTMLParser):
+        token: str | None = None
+
+        def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+            attributes = dict(attrs)
+            if tag == "input" and attributes.get("name") == "csrftoken" and attributes.get("type") == "hidden":
+                self.token = attributes.get("value")
+
+    parser = CsrfTokenParser()
+    parser.feed(page)
+    return parser.token
+
+
+def _backoff_delay(retry: int) -> float:
+    """Return the delay, in seconds, before the given retry: exponential, capped, with full jitter."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2 ** retry))
+
+
+def _fingerprint_bookings(items: list, total) -> str:
+    """Hash the most recent bookings along with their `pagination.total`, see `AvantioClient.probe_bookings`."""
+    fingerprint = json.dumps([int(total) if total is not None else None, items], sort_keys=True)
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+
+def _probe_fingerprint(items: list, pagination_obj: dict) -> str | None:
+    """Compute what `AvantioClient.probe_bookings` would return from a first page of any size, or None if unknown.
+
+    The probe sees the first DEFAULT_PAGE_SIZE bookings, so a shorter page followed by others cannot tell. As for
+    `pagination.total`, it is the same whatever the page size when it is the size of the whole collection, and the
+    number of items up to the page when it is a running count, i.e. DEFAULT_PAGE_SIZE for the probe. A page larger
+    than the probe's tells which one it is, unless it holds the whole collection.
+    """
+    has_next = bool(pagination_obj.get("hasNextPage", False))
+    if len(items) < DEFAULT_PAGE_SIZE and has_next:
+        return None
+    total = pagination_obj.get("total")
+    if total is not None and len(items) > DEFAULT_PAGE_SIZE:
+        if int(total) > len(items):
+            # size of the whole collection
+            pass
+        elif has_next:
+            # running count, which stops at the end of the probe's page
+            total = DEFAULT_PAGE_SIZE
+        else:
+            return None
+    return _fingerprint_bookings(items[:DEFAULT_PAGE_SIZE], total)
+
+
+def _extract_path(obj: dict, path: str):
+    """Return the value found at the given dot-separated path, or None."""
+    if not path:
+        return obj
+    cur = obj
+    for part in path.split("."):
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(part)
+        if cur is None:
+            return None
+    return cur
+
+
+class LoggedOut(Exception):
+    """Error to indicate Avantio redirected to the login page."""
+
 
-        async with aiohttp.ClientSession(headers=self._base_headers) as session:
-            # use shared pagination helper to aggregate all pages
-            return await self.pagination(session=session, booking_data=booking_data, data_path="accommodations")
+class TransientError(Exception):
+    """Error to indicate a request failed in a way that is worth retrying."""
 
 
 class CannotConnect(HomeAssistantError):
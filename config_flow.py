@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import secrets
 from typing import Any
 
 import voluptuous as vol
@@ -14,6 +15,7 @@ from homeassistant.config_entries import (
     OptionsFlow,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.selector import (
     TextSelector,
     TextSelectorConfig,
@@ -21,7 +23,22 @@ from homeassistant.helpers.selector import (
 )
 
 from .client import AvantioClient, CannotConnect, InvalidAuth
-from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .const import (
+    CONF_FEED_TOKEN,
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    CONF_PASSWORD,
+    CONF_ROTATE_FEED_TOKEN,
+    CONF_USERNAME,
+    DATA_POOL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DOMAIN,
+    FEED_KINDS,
+    FEED_URL,
+)
+from .coordinator import AvantioCoordinator
+from .pool import AvantioClientPool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -37,14 +54,36 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
-    """Validate the user input allows us to connect."""
-    client = AvantioClient(username=data[CONF_USERNAME], password=data[CONF_PASSWORD])
-    is_signed_in = await client.sign_in()
-    await client.close()
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> AvantioClient:
+    """Validate the user input allows us to connect.
+
+    Returns the signed in client, for the setup of the entry to reuse its session through `hand_off_client`.
+    """
+    pool: AvantioClientPool | None = hass.data.get(DATA_POOL)
+    if pool is not None:
+        client = pool.create_client(hass, username=data[CONF_USERNAME], password=data[CONF_PASSWORD])
+    else:
+        client = AvantioClient(username=data[CONF_USERNAME], password=data[CONF_PASSWORD])
+
+    try:
+        is_signed_in = await client.sign_in()
+    except BaseException:
+        await client.close()
+        raise
 
     if is_signed_in is False:
+        await client.close()
         raise InvalidAuth
+    return client
+
+
+async def hand_off_client(hass: HomeAssistant, client: AvantioClient) -> None:
+    """Hand a client returned by `validate_input` off to the setup of its entry, or close it if there is none."""
+    pool: AvantioClientPool | None = hass.data.get(DATA_POOL)
+    if pool is not None:
+        pool.hand_off(hass, client)
+    else:
+        await client.close()
 
 
 class AvantioConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -57,7 +96,7 @@ class AvantioConfigFlow(ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                await validate_input(self.hass, user_input)
+                client = await validate_input(self.hass, user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except InvalidAuth:
@@ -66,6 +105,7 @@ class AvantioConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
+                await hand_off_client(self.hass, client)
                 return self.async_create_entry(
                     title=user_input["username"], data=user_input
                 )
@@ -81,13 +121,46 @@ class AvantioConfigFlow(ConfigFlow, domain=DOMAIN):
     async def async_step_reauth_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Dialog that informs the user that reauth is required."""
-        if user_input is None:
-            return self.async_show_form(
-                step_id="reauth_confirm",
-                data_schema=vol.Schema({}),
-            )
-        return await self.async_step_user()
+        """Dialog that asks for the new credentials.
+
+        When the entry is loaded, only the credentials of its live client change, keeping its session and data.
+        Otherwise, the client signed in here is handed off to the reload of the entry.
+        """
+        entry = self.hass.config_entries.async_get_entry(self.context["entry_id"])
+        errors = {}
+        if user_input is not None:
+            coordinator: AvantioCoordinator | None = self.hass.data.get(DOMAIN, {}).get(entry.entry_id)
+            client = None
+            try:
+                if coordinator is not None:
+                    await coordinator.async_change_credentials(
+                        user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
+                    )
+                else:
+                    client = await validate_input(self.hass, user_input)
+            except CannotConnect:
+                errors["base"] = "cannot_connect"
+            except InvalidAuth:
+                errors["base"] = "invalid_auth"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected exception")
+                errors["base"] = "unknown"
+            else:
+                data = {**entry.data, **user_input}
+                if client is None:
+                    # the live client is already signed in with the new credentials, no need to reload
+                    self.hass.config_entries.async_update_entry(entry, data=data)
+                    return self.async_abort(reason="reauth_successful")
+                await hand_off_client(self.hass, client)
+                return self.async_update_reload_and_abort(entry, data=data)
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_USER_DATA_SCHEMA, {CONF_USERNAME: entry.data.get(CONF_USERNAME)}
+            ),
+            errors=errors,
+        )
 
     @staticmethod
     @callback
@@ -104,11 +177,22 @@ class AvantioOptionsFlow(OptionsFlow):
         self.config_entry = config_entry
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
-        """Manage the options."""
+        """Manage the options, and show the URLs of the calendar feeds, which are only visible to admins here."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(
-                title=user_input[CONF_USERNAME], data=user_input
-            )
+            if user_input[CONF_MAX_UPDATE_INTERVAL] < user_input[CONF_MIN_UPDATE_INTERVAL]:
+                errors["base"] = "invalid_update_interval"
+            else:
+                user_input = dict(user_input)
+                if user_input.pop(CONF_ROTATE_FEED_TOKEN, False):
+                    # the feed view reads the token from the entry, the previous URLs stop working right away
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry,
+                        data={**self.config_entry.data, CONF_FEED_TOKEN: secrets.token_urlsafe(32)},
+                    )
+                return self.async_create_entry(
+                    title=user_input[CONF_USERNAME], data=user_input
+                )
 
         options_schema = vol.Schema(
             {
@@ -118,7 +202,42 @@ class AvantioOptionsFlow(OptionsFlow):
                 vol.Required(
                     CONF_PASSWORD, default=self.config_entry.data.get(CONF_PASSWORD, "")
                 ): str,
+                vol.Required(
+                    CONF_MIN_UPDATE_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Required(
+                    CONF_MAX_UPDATE_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=5)),
+                vol.Optional(CONF_ROTATE_FEED_TOKEN, default=False): bool,
             }
         )
 
-        return self.async_show_form(step_id="init", data_schema=options_schema)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=options_schema,
+            errors=errors,
+            description_placeholders={"feed_urls": self._describe_feed_urls()},
+        )
+
+    def _describe_feed_urls(self) -> str:
+        """List the URLs of the calendar feeds of the entry, as markdown."""
+        token = self.config_entry.data.get(CONF_FEED_TOKEN)
+        coordinator: AvantioCoordinator | None = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if token is None or coordinator is None:
+            return "-"
+        try:
+            base_url = get_url(self.hass)
+        except NoURLAvailableError:
+            base_url = ""
+        return "\n".join(
+            f"- {accommodation.get('name', accommodation['id'])} ({kind}): "
+            f"`{base_url}{FEED_URL.format(token=token, accommodation_id=accommodation['id'], kind=kind)}`"
+            for accommodation in coordinator.get_accommodations()
+            for kind in FEED_KINDS
+        ) or "-"
@@ -3,4 +3,35 @@
 DOMAIN = "avantio"
 
 CONF_USERNAME = "username"
-CONF_PASSWORD = "password"
\ No newline at end of file
+CONF_PASSWORD = "password"
+CONF_FEED_TOKEN = "feed_token"
+CONF_ROTATE_FEED_TOKEN = "rotate_feed_token"
+CONF_MIN_UPDATE_INTERVAL = "min_update_interval"
+CONF_MAX_UPDATE_INTERVAL = "max_update_interval"
+
+# Bounds of the polling interval, in minutes
+DEFAULT_MIN_UPDATE_INTERVAL = 30
+DEFAULT_MAX_UPDATE_INTERVAL = 24 * 60
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_MAX_REQUESTS_PER_SECOND = "max_requests_per_second"
+CONF_STARTUP_JITTER = "startup_jitter"
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_MAX_REQUESTS_PER_SECOND = 2.0
+# Maximum delay, in seconds, before the first refresh of each account, so they do not all start at once
+DEFAULT_STARTUP_JITTER = 30
+
+DATA_POOL = f"{DOMAIN}_pool"
+
+# Dispatched with the config entry id, after each refresh of its coordinator
+SIGNAL_REFRESH_STATS = f"{DOMAIN}_refresh_stats_{{}}"
+
+SERVICE_CHECK_AVAILABILITY = "check_availability"
+ATTR_ACCOMMODATION_ID = "accommodation_id"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_NIGHTS = "nights"
+
+# Path of the iCalendar feeds, authenticated by the secret token of their config entry
+FEED_URL = "/api/avantio/feed/{token}/{accommodation_id}/{kind}.ics"
+FEED_KINDS = {"rental": True, "owner": False}
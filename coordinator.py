@@ -1,18 +1,64 @@
 """Fetch data using the given AvantioClient, for a specific HomeAssistant ConfigEntry."""
 
+import asyncio
 from collections import defaultdict
-from datetime import datetime, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
 import logging
+import time
 from zoneinfo import ZoneInfo
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .client import AvantioClient, InvalidAuth
+from homeassistant.util import dt as dt_util
+
+from .analytics import BookingsAnalytics, MonthlyTotals
+from .client import AvantioClient, ClientStats, InvalidAuth
+from .const import (
+    CONF_MAX_UPDATE_INTERVAL,
+    CONF_MIN_UPDATE_INTERVAL,
+    DEFAULT_MAX_UPDATE_INTERVAL,
+    DEFAULT_MIN_UPDATE_INTERVAL,
+    DOMAIN,
+    SIGNAL_REFRESH_STATS,
+)
+from .ics import CalendarFeed
+from .models import Booking, parse_date
+from .occupancy import DayOccupancy
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bookings checking-in before this many days ago are considered settled, and are not fetched again by incremental syncs
+SYNC_LOOKBACK = timedelta(days=30)
+# Interval after which the whole bookings history is fetched again, to catch changes on settled bookings
+FULL_SYNC_INTERVAL = timedelta(days=7)
+# Interval after which bookings are synced incrementally even if their fingerprint did not change, to catch changes
+# on bookings beyond the first page of the probe
+INCREMENTAL_SYNC_INTERVAL = timedelta(hours=6)
+
+# Bookings checking-in or out within this delay make the coordinator poll at its minimum interval
+NEAR_CHANGEOVER = timedelta(hours=48)
+
+SNAPSHOT_VERSION = 2
+# Delay, in seconds, before the snapshot of the last fetched data is written to disk
+SNAPSHOT_SAVE_DELAY = 10
+
+
+@dataclass(slots=True)
+class RefreshStats:
+    """Statistics of a coordinator refresh, durations in seconds."""
+
+    started: datetime
+    duration: float = 0.0
+    # time spent turning rows into bookings and merging them
+    processing_time: float = 0.0
+    skipped: bool = False
+    success: bool = False
+    client: ClientStats = field(default_factory=ClientStats)
+
 
 class AvantioCoordinator(DataUpdateCoordinator):
     """My custom coordinator."""
@@ -24,142 +70,430 @@ class AvantioCoordinator(DataUpdateCoordinator):
             _LOGGER,
             # Name of the data. For logging purposes.
             name="Travel Paradise Locations",
-            # Polling interval. Will only be polled if there are subscribers.
+            # Polling interval. Will only be polled if there are subscribers. Adapted after each refresh.
             update_interval=timedelta(days=1),
+            # Entities are only updated when bookings actually changed
+            always_update=False,
         )
+        self.update_interval = self._get_update_interval_bounds()[0]
         self._client = client
-        self._events = None
-        self._total_earnings = None
-        self._yearly_earnings = None
+        self._bookings: dict[str, Booking] = {}
+        # Earnings and occupancy by month, per accommodation, kept up to date as bookings are added and removed
+        self._analytics = BookingsAnalytics()
         self._accommodations = None
-
-    async def _async_setup(self):
-        """Set up the coordinator."""
-        await self.async_request_refresh()
-        return True
+        # Bookings grouped by accommodation id, then by `is_rental`
+        self._index: dict[str, dict[bool, list[Booking]]] = {}
+        # Content hash of each slice of the index, for entities to skip updates when their slice did not change
+        self._index_hashes: dict[tuple[str, bool], int] = {}
+        # Day by day occupancy of each accommodation, rebuilt when its bookings change
+        self._occupancy: dict[str, DayOccupancy] = {}
+        # Serialized iCalendar feed of each slice of the index, along with the hash of the slice it was built from
+        self._feeds: dict[tuple[str, bool], tuple[int, CalendarFeed]] = {}
+        self._watermark: date | None = None
+        self._last_full_sync: datetime | None = None
+        # Time of the last sync, full or incremental, i.e. of the last refresh that was not skipped
+        self._last_sync: datetime | None = None
+        # Fingerprint of the bookings, as returned by the client probe, when they were last fetched
+        self._fingerprint: str | None = None
+        self._last_refresh: RefreshStats | None = None
+        # Fetch in flight, shared by all the refreshes requested while it runs
+        self._fetch_task: asyncio.Task | None = None
+        self._store = SnapshotStore(hass, self.config_entry.entry_id)
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and close the client session."""
+        await super().async_shutdown()
+        await self._client.close()
+
+    async def async_change_credentials(self, username: str, password: str) -> None:
+        """Sign the client in with new credentials, then refresh in the background.
+
+        The refresh also resumes the polling, which stops after an authentication failure. Raises `InvalidAuth` if
+        the credentials are rejected.
+        """
+        await self._client.change_credentials(username, password)
+        self.config_entry.async_create_background_task(
+            self.hass, self.async_refresh(), f"{DOMAIN} refresh {self.config_entry.entry_id}"
+        )
 
     async def _async_update_data(self):
+        """Fetch data from API endpoint, or join the fetch already in flight.
+
+        Refreshes requested concurrently, e.g. scheduled, requested by entities and at setup, share a single fetch
+        and its result. A caller being cancelled does not cancel the fetch for the others.
+        """
+        if self._fetch_task is None:
+            self._fetch_task = self.hass.async_create_task(self._async_fetch_with_stats())
+            self._fetch_task.add_done_callback(self._fetch_done)
+        return await asyncio.shield(self._fetch_task)
+
+    def _fetch_done(self, task: asyncio.Task) -> None:
+        """Forget the fetch once done, so the next refresh fetches again."""
+        if task is self._fetch_task:
+            self._fetch_task = None
+        if not task.cancelled():
+            # retrieve the exception, in case no caller is awaiting the fetch anymore
+            task.exception()
+
+    async def _async_fetch_with_stats(self):
+        """Fetch data from API endpoint, and record statistics about the refresh."""
+        stats = RefreshStats(started=dt_util.utcnow())
+        self._client.stats = stats.client
+        started = time.monotonic()
+        try:
+            return await self._async_fetch_data(stats)
+        finally:
+            stats.duration = time.monotonic() - started
+            self._last_refresh = stats
+            async_dispatcher_send(self.hass, SIGNAL_REFRESH_STATS.format(self.config_entry.entry_id))
+
+    async def _async_fetch_data(self, stats: RefreshStats):
         """Fetch data from API endpoint.
 
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
+
+        Bookings are synced incrementally: only those checking-in after the watermark are fetched and merged into the
+        ones already known, unless a full sync is due. Until then, the refresh is skipped altogether when the bookings
+        fingerprint did not change, for up to INCREMENTAL_SYNC_INTERVAL. The fingerprint is only probed when the refresh
+        may be skipped: syncs compute it from the first page of bookings they fetch anyway.
         """
         try:
-            data = await self._client.get_bookings()
-            timezone = ZoneInfo(self.hass.config.time_zone)
-
-            self._events = [
-                {
-                    "uid": row["id"],
-                    "start": parse_date_with_time(row["bookingStart"], 17, timezone),
-                    "end": parse_date_with_time(row["bookingEnd"], 10, timezone),
-                    "summary": row["id"],
-                    "description": "\n".join(
-                        [
-                            f"🧑‍🧑‍🧒‍🧒 {stringify_guests(row['guests'])}",
-                            f"💸 {row['amount']}"
-                            if row["status"]["name"] != "PROPIETARIO"
-                            else "",
-                            "",
-                            f"Réservé via {row['agent']['name']}"
-                            if row["agent"]["name"] != ""
-                            else "",
-                        ]
-                    ),
-                    "is_rental": row["status"]["name"] != "PROPIETARIO",
-                }
-                for row in data
-            ]
-
-            self._total_earnings = sum(
-                map(
-                    float,
-                    [row["amount"].replace(",", "").replace("€", "") for row in data],
-                )
+            now = dt_util.utcnow()
+            full_sync = (
+                self._watermark is None
+                or self._last_full_sync is None
+                or now - self._last_full_sync >= FULL_SYNC_INTERVAL
             )
-            yearly_earnings = defaultdict(float)
-            for row in data:
-                year = datetime.strptime(row["bookingStart"], "%d %b %Y").year
-                yearly_earnings[year] += float(
-                    row["amount"].replace(",", "").replace("€", "")
-                )
-
-            self._yearly_earnings = dict(yearly_earnings)
-
-            self._accommodations = await self._client.get_accommodations()
+            since = None if full_sync else self._watermark
+
+            fingerprint = None
+            sync_due = self._last_sync is None or now - self._last_sync >= INCREMENTAL_SYNC_INTERVAL
+            if not full_sync and not sync_due:
+                # the probe is only worth a request when the sync may be skipped
+                fingerprint = await self._client.probe_bookings()
+                if fingerprint == self._fingerprint:
+                    _LOGGER.debug("Bookings of %s did not change, skipping refresh", self.config_entry.entry_id)
+                    self.update_interval = self._next_update_interval(False, now)
+                    stats.skipped = True
+                    stats.success = True
+                    return self.get_bookings()
+
+            # both endpoints are independent: bookings are processed while accommodations are being fetched. When
+            # either fails, the other one is cancelled instead of being left running
+            try:
+                async with asyncio.TaskGroup() as group:
+                    bookings_task = group.create_task(self._async_fetch_bookings(since, stats))
+                    accommodations_task = group.create_task(self._client.get_accommodations())
+            except ExceptionGroup as err:
+                # handled below like any error of the refresh, e.g. InvalidAuth
+                raise err.exceptions[0] from None
+            fetched, page_fingerprint = bookings_task.result()
+            accommodations = accommodations_task.result()
+            if accommodations is None:
+                # neither saved nor marked as synced, so that the snapshot never loses the accommodations
+                raise UpdateFailed("Error fetching accommodations")
+            if page_fingerprint is not None:
+                fingerprint = page_fingerprint
+            elif fingerprint is None:
+                fingerprint = await self._client.probe_bookings()
+            fetched = self._assign_orphans(fetched, accommodations)
+            self._accommodations = accommodations
+
+            started = time.monotonic()
+            changed = self._merge_bookings(fetched, since)
+            stats.processing_time += time.monotonic() - started
+
+            if full_sync:
+                self._last_full_sync = now
+            self._last_sync = now
+            self._watermark = now.date() - SYNC_LOOKBACK
+            self._fingerprint = fingerprint
+            self.update_interval = self._next_update_interval(changed, now)
+
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+            stats.success = True
         except InvalidAuth as err:
             raise ConfigEntryAuthFailed(
                 f"Credentials expired for {self.config_entry.entry_id}"
             ) from err
+        except UpdateFailed:
+            raise
         except Exception as err:
             raise UpdateFailed(f"Error fetching booking data: {err}") from err
 
-        return self._events
+        return self.get_bookings()
+
+    async def _async_fetch_bookings(
+        self, since: date | None, stats: RefreshStats
+    ) -> tuple[dict[str, Booking], str | None]:
+        """Fetch the bookings checking-in from the given date, or all of them, keyed by id.
+
+        Also returns the bookings fingerprint, as `probe_bookings` would compute it from the first page, or None if
+        that page cannot tell.
+        """
+        # rows are turned into bookings as pages arrive, while the next ones are being fetched
+        timezone = ZoneInfo(self.hass.config.time_zone)
+        fetched: dict[str, Booking] = {}
+        fingerprints: list[str | None] = []
+        async for rows in self._client.iter_bookings(
+            stop_when=None
+            if since is None
+            else lambda items: len(items) > 0 and parse_date(items[-1]["bookingStart"]) < since,
+            on_fingerprint=fingerprints.append,
+        ):
+            started = time.monotonic()
+            for row in rows:
+                booking = Booking.from_row(row, timezone)
+                if since is None or booking.start.date() >= since:
+                    fetched[booking.id] = booking
+            stats.processing_time += time.monotonic() - started
+        return fetched, fingerprints[0] if fingerprints else None
+
+    @staticmethod
+    def _assign_orphans(fetched: dict[str, Booking], accommodations: list[dict]) -> dict[str, Booking]:
+        """Assign the fetched bookings without an accommodation id to the accommodation of the account, if alone.
+
+        Raises `UpdateFailed` otherwise, rather than publishing bookings that no entity would show.
+        """
+        orphans = [booking.id for booking in fetched.values() if booking.accommodation_id is None]
+        if not orphans:
+            return fetched
+        if len(accommodations) != 1:
+            raise UpdateFailed(
+                f"{len(orphans)} of {len(fetched)} fetched bookings have no accommodation id (e.g. "
+                f"{', '.join(orphans[:5])}): their rows have neither `accommodation.id` nor `accommodationId`"
+            )
+        accommodation_id = str(accommodations[0]["id"])
+        _LOGGER.debug("Assigning %s bookings without accommodation id to %s", len(orphans), accommodation_id)
+        return {
+            booking_id: replace(booking, accommodation_id=accommodation_id)
+            if booking.accommodation_id is None
+            else booking
+            for booking_id, booking in fetched.items()
+        }
+
+    def _get_update_interval_bounds(self) -> tuple[timedelta, timedelta]:
+        """Get the minimum and maximum polling intervals, from the config entry options."""
+        options = self.config_entry.options
+        return (
+            timedelta(minutes=options.get(CONF_MIN_UPDATE_INTERVAL, DEFAULT_MIN_UPDATE_INTERVAL)),
+            timedelta(minutes=options.get(CONF_MAX_UPDATE_INTERVAL, DEFAULT_MAX_UPDATE_INTERVAL)),
+        )
+
+    def _next_update_interval(self, changed: bool, now: datetime) -> timedelta:
+        """Poll at the minimum interval around changeovers or after changes, back off exponentially otherwise."""
+        min_interval, max_interval = self._get_update_interval_bounds()
+        horizon = now + NEAR_CHANGEOVER
+        near_changeover = any(
+            now <= booking.start <= horizon or now <= booking.end <= horizon
+            for booking in self._bookings.values()
+        )
+        if changed or near_changeover:
+            interval = min_interval
+        else:
+            interval = min(self.update_interval * 2, max_interval)
+        interval = max(interval, min_interval)
+
+        _LOGGER.debug("Next refresh of %s in %s", self.config_entry.entry_id, interval)
+        return interval
+
+    async def async_load_snapshot(self) -> bool:
+        """Restore the data saved by the last successful refresh, if any.
+
+        Returns True if the coordinator now holds data, False if there was nothing to restore.
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot or not snapshot.get("accommodations"):
+            # without accommodations, no entity could be created from the snapshot
+            return False
+
+        try:
+            bookings = (Booking.from_list(values) for values in snapshot["bookings"])
+            self._merge_bookings({booking.id: booking for booking in bookings}, None)
+            self._accommodations = snapshot["accommodations"]
+            self._watermark = date.fromisoformat(snapshot["watermark"])
+            self._last_full_sync = datetime.fromisoformat(snapshot["last_full_sync"])
+            self._fingerprint = snapshot.get("fingerprint")
+            self._client.restore_page_sizes(snapshot.get("page_sizes", {}))
+        except (ArithmeticError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.warning("Ignoring invalid snapshot of %s: %s", self.config_entry.entry_id, err)
+            self._bookings.clear()
+            self._index.clear()
+            self._index_hashes.clear()
+            self._occupancy.clear()
+            self._feeds.clear()
+            self._analytics.clear()
+            self._accommodations = None
+            self._watermark = None
+            self._last_full_sync = None
+            self._fingerprint = None
+            return False
+
+        _LOGGER.debug("Restored %s bookings from snapshot", len(self._bookings))
+        self.async_set_updated_data(self.get_bookings())
+        return True
+
+    def _snapshot(self) -> dict:
+        """Serialize the data needed to restore the coordinator without fetching Avantio."""
+        return {
+            "bookings": [booking.as_list() for booking in self._bookings.values()],
+            "accommodations": self.get_accommodations(),
+            "watermark": self._watermark.isoformat() if self._watermark else None,
+            "last_full_sync": self._last_full_sync.isoformat() if self._last_full_sync else None,
+            "fingerprint": self._fingerprint,
+            "page_sizes": self._client.page_sizes,
+        }
+
+    def _merge_bookings(self, fetched: dict[str, Booking], since: date | None) -> bool:
+        """Merge the fetched bookings, keyed by id, into the known ones.
+
+        since: check-in date from which `fetched` is complete. Known bookings in that window which are not part of
+        `fetched` anymore are removed. None means `fetched` is the whole history.
+
+        Returns whether any booking was added, changed or removed.
+        """
+        removed = [
+            booking_id
+            for booking_id, booking in self._bookings.items()
+            if booking_id not in fetched
+            and (since is None or booking.start.date() >= since)
+        ]
+        for booking_id in removed:
+            self._remove_booking(booking_id)
+
+        updated = 0
+        for booking_id, booking in fetched.items():
+            if self._bookings.get(booking_id) == booking:
+                continue
+            self._remove_booking(booking_id)
+            self._add_booking(booking)
+            updated += 1
+
+        self._rebuild_index()
+
+        _LOGGER.debug(
+            "Merged %s fetched bookings (%s added or changed, %s removed), %s bookings known",
+            len(fetched),
+            updated,
+            len(removed),
+            len(self._bookings),
+        )
+        return updated > 0 or len(removed) > 0
+
+    def _rebuild_index(self) -> None:
+        """Group the bookings by accommodation and rental/owner type, in a single pass.
+
+        The occupancy of the accommodations whose bookings changed is rebuilt as well.
+        """
+        index: dict[str, dict[bool, list[Booking]]] = defaultdict(lambda: {True: [], False: []})
+        for booking in self._bookings.values():
+            index[booking.accommodation_id][booking.is_rental].append(booking)
+        self._index = dict(index)
+        previous_hashes = self._index_hashes
+        self._index_hashes = {
+            (accommodation_id, is_rental): hash(frozenset(bookings))
+            for accommodation_id, slices in self._index.items()
+            for is_rental, bookings in slices.items()
+        }
+        occupancy: dict[str, DayOccupancy] = {}
+        for accommodation_id, slices in self._index.items():
+            unchanged = all(
+                previous_hashes.get(key) == self._index_hashes[key]
+                for key in ((accommodation_id, True), (accommodation_id, False))
+            )
+            if unchanged and accommodation_id in self._occupancy:
+                occupancy[accommodation_id] = self._occupancy[accommodation_id]
+            else:
+                occupancy[accommodation_id] = DayOccupancy([*slices[True], *slices[False]])
+        self._occupancy = occupancy
+
+    def _add_booking(self, booking: Booking) -> None:
+        """Add a booking to the lookup tables and analytics."""
+        self._bookings[booking.id] = booking
+        self._analytics.add(booking)
+
+    def _remove_booking(self, booking_id: str) -> None:
+        """Remove a booking from the lookup tables and analytics, if known."""
+        booking = self._bookings.pop(booking_id, None)
+        if booking is None:
+            return
+        self._analytics.remove(booking)
 
     def get_bookings(self):
         """Get all bookings, i.e. for guests and owners."""
-        return self._events if self._events is not None else []
+        return list(self._bookings.values())
 
     def get_bookings_guests(self):
         """Filter bookings where `is_rental` is True."""
-        return [event for event in self.get_bookings() if event.get("is_rental", False)]
+        return [booking for booking in self.get_bookings() if booking.is_rental]
 
     def get_bookings_owner(self):
         """Filter bookings where `is_rental` is False."""
-        return [event for event in self.get_bookings() if not event.get("is_rental", False)]
+        return [booking for booking in self.get_bookings() if not booking.is_rental]
 
-    def get_total_earnings(self):
-        """Get the total earnings sum, in euros."""
-        return self._total_earnings
+    def get_accommodation_bookings(self, accommodation_id, is_rental: bool) -> list[Booking]:
+        """Get the bookings of a given accommodation, either for guests or owners."""
+        return self._index.get(str(accommodation_id), {}).get(is_rental, [])
 
-    def get_yearly_earnings(self):
-        """Get the yearly earning map, in euros."""
-        return self._yearly_earnings if self._yearly_earnings is not None else {}
+    def get_accommodation_bookings_hash(self, accommodation_id, is_rental: bool) -> int:
+        """Get the content hash of the bookings of a given accommodation, either for guests or owners."""
+        return self._index_hashes.get((str(accommodation_id), is_rental), hash(frozenset()))
 
-    def get_accommodations(self):
-        """Get the accommodations map."""
-        return self._accommodations if self._accommodations is not None else []
+    def get_calendar_feed(self, accommodation_id, is_rental: bool) -> CalendarFeed:
+        """Get the iCalendar feed of the bookings of a given accommodation, either for guests or owners.
 
-def parse_date_with_time(date_str: str, hour: int, timezone: ZoneInfo) -> datetime:
-    """Parse a date in the format '%d %b %Y', set the time, and add timezone info."""
-    date = datetime.strptime(date_str, "%d %b %Y")
-    return date.astimezone(timezone).replace(hour=hour)
+        The feed is serialized on the first request following a change of these bookings, then served from cache.
+        """
+        key = (str(accommodation_id), is_rental)
+        bookings_hash = self.get_accommodation_bookings_hash(accommodation_id, is_rental)
+        cached = self._feeds.get(key)
+        if cached is not None and cached[0] == bookings_hash:
+            return cached[1]
+
+        feed = CalendarFeed.from_bookings(
+            self.get_accommodation_bookings(accommodation_id, is_rental), dt_util.utcnow()
+        )
+        self._feeds[key] = (bookings_hash, feed)
+        return feed
 
+    def get_occupancy(self, accommodation_id) -> DayOccupancy:
+        """Get the day by day occupancy of a given accommodation."""
+        occupancy = self._occupancy.get(str(accommodation_id))
+        return occupancy if occupancy is not None else DayOccupancy()
 
-def stringify_guests(guests: dict) -> str:
-    """Stringify the guests information."""
-    if guests is None:
-        return "**Unknown**"
+    def get_last_refresh(self) -> RefreshStats | None:
+        """Get the statistics of the last refresh, if any."""
+        return self._last_refresh
 
-    num_adults = guests.get("numAdults", 0)
-    num_children = guests.get("numChildren", 0)
-    num_babies = guests.get("numBabies", 0)
-    children_ages = [age for age in guests.get("childrenAges", []) if age > 0]
+    def get_page_sizes(self) -> dict[str, int]:
+        """Get the page size tuned for each Avantio endpoint."""
+        return self._client.page_sizes
 
-    parts = []
+    def get_analytics(self, accommodation_id=None) -> MonthlyTotals:
+        """Get the monthly earnings and occupancy of a given accommodation, or of the whole account when omitted."""
+        return self._analytics.get(accommodation_id)
 
-    total_people = num_adults + num_children + num_babies
-    if total_people > 0:
-        parts.append(f"{total_people} personnes")
+    def get_total_earnings(self, accommodation_id=None):
+        """Get the total earnings sum, in euros, of a given accommodation, or of the whole account when omitted."""
+        return self._analytics.get(accommodation_id).total_earnings()
 
-    breakdown = []
-    if num_adults > 0:
-        breakdown.append(f"{num_adults} adultes")
+    def get_yearly_earnings(self, accommodation_id=None):
+        """Get the yearly earning map, in euros, of a given accommodation, or of the whole account when omitted."""
+        return self._analytics.get(accommodation_id).yearly_earnings()
 
-    if num_children > 0:
-        breakdown.append(f"{num_children} enfants")
+    def get_accommodations(self):
+        """Get the accommodations map."""
+        return self._accommodations if self._accommodations is not None else []
 
-    if num_babies > 0:
-        breakdown.append(f"{num_babies} bébés")
 
-    details = []
-    if len(breakdown) > 0:
-        details.append(", ".join(breakdown))
-    if len(children_ages) > 0:
-        ages = ", ".join(map(str, children_ages))
-        details.append(f"(ages {ages} ans)")
+class SnapshotStore(Store[dict]):
+    """Store of the coordinator data, discarding snapshots written in an older format."""
 
-    if len(details) > 0:
-        parts.append(" ".join(details))
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store of the given config entry."""
+        super().__init__(hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}")
 
-    return " – ".join(parts)
+    async def _async_migrate_func(self, old_major_version: int, old_minor_version: int, old_data: dict) -> dict:
+        """Discard the old snapshot, the next refresh fetches everything again."""
+        return {}
@@ -0,0 +1,32 @@
+"""Diagnostics support for the Avantio integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_FEED_TOKEN, CONF_PASSWORD, CONF_USERNAME, DOMAIN
+from .coordinator import AvantioCoordinator
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD, CONF_FEED_TOKEN, "title"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AvantioCoordinator = hass.data[DOMAIN][entry.entry_id]
+    last_refresh = coordinator.get_last_refresh()
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "update_interval": str(coordinator.update_interval),
+        "bookings": len(coordinator.get_bookings()),
+        "accommodations": len(coordinator.get_accommodations()),
+        "page_sizes": coordinator.get_page_sizes(),
+        "last_refresh": asdict(last_refresh) if last_refresh is not None else None,
+    }
@@ -0,0 +1,64 @@
+"""HTTP view serving the bookings of each accommodation as an iCalendar feed, for external tools to poll."""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+import secrets
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_FEED_TOKEN, DOMAIN, FEED_KINDS, FEED_URL
+from .coordinator import AvantioCoordinator
+
+
+class CalendarFeedView(HomeAssistantView):
+    """Serve the rental or owner bookings of an accommodation as an iCalendar feed.
+
+    Feeds are authenticated by the secret token of their config entry, in their path, since calendar tools cannot
+    send Home Assistant credentials. They are served from the cache of the coordinator, and never trigger a fetch of
+    Avantio. Pollers sending back the ETag of the feed get a 304 while the bookings did not change.
+    """
+
+    url = FEED_URL
+    name = f"api:{DOMAIN}:feed"
+    requires_auth = False
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(
+        self, request: web.Request, token: str, accommodation_id: str, kind: str
+    ) -> web.Response:
+        """Return the feed, or 304 if it did not change since the ETag sent by the client."""
+        coordinator = self._get_coordinator(token)
+        if (
+            coordinator is None
+            or kind not in FEED_KINDS
+            or all(str(accommodation["id"]) != accommodation_id for accommodation in coordinator.get_accommodations())
+        ):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+
+        feed = coordinator.get_calendar_feed(accommodation_id, FEED_KINDS[kind])
+        headers = {"ETag": feed.etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("If-None-Match", "")
+        # weak comparison, as for any conditional GET
+        if if_none_match.strip() == "*" or feed.etag.removeprefix("W/") in (
+            etag.strip().removeprefix("W/") for etag in if_none_match.split(",")
+        ):
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        return web.Response(body=feed.body, content_type="text/calendar", charset="utf-8", headers=headers)
+
+    def _get_coordinator(self, token: str) -> AvantioCoordinator | None:
+        """Get the coordinator of the config entry with the given feed token, if any."""
+        coordinator: AvantioCoordinator
+        for coordinator in self.hass.data.get(DOMAIN, {}).values():
+            if secrets.compare_digest(
+                coordinator.config_entry.data.get(CONF_FEED_TOKEN, "").encode(), token.encode()
+            ):
+                return coordinator
+        return None
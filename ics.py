@@ -0,0 +1,95 @@
+"""iCalendar serialization of the bookings, for the calendar feeds served to external tools."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import hashlib
+import json
+
+from .models import Booking
+
+PRODUCT_ID = "-//ha-avantio//Avantio//EN"
+# Maximum length of a content line, in octets, before it is folded
+MAX_LINE_LENGTH = 75
+
+
+@dataclass(slots=True, frozen=True)
+class CalendarFeed:
+    """Serialized iCalendar feed, along with its entity tag for conditional requests."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_bookings(cls, bookings: Iterable[Booking], stamp: datetime) -> CalendarFeed:
+        """Serialize the given bookings, sorted by start. `stamp` is the time the feed is created at.
+
+        The entity tag is derived from the bookings only, so it stays the same across rebuilds and restarts as long
+        as the bookings do, although `stamp` changes. It is weak, since the bodies then only differ by their stamp.
+        """
+        bookings = sorted(bookings, key=lambda booking: (booking.start, booking.id))
+        digest = hashlib.sha256(json.dumps([booking.as_list() for booking in bookings]).encode()).hexdigest()
+        return cls(body=serialize_calendar(bookings, stamp), etag=f'W/"{digest[:32]}"')
+
+
+def serialize_calendar(bookings: Iterable[Booking], stamp: datetime) -> bytes:
+    """Serialize the given bookings as an iCalendar (RFC 5545) document, one event per booking."""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODUCT_ID}",
+        "CALSCALE:GREGORIAN",
+    ]
+    for booking in sorted(bookings, key=lambda booking: booking.start):
+        lines.extend(
+            [
+                "BEGIN:VEVENT",
+                f"UID:{escape_text(booking.id)}",
+                f"DTSTAMP:{format_datetime(stamp)}",
+                f"DTSTART:{format_datetime(booking.start)}",
+                f"DTEND:{format_datetime(booking.end)}",
+                f"SUMMARY:{escape_text(booking.id)}",
+                f"DESCRIPTION:{escape_text(booking.description)}",
+                "END:VEVENT",
+            ]
+        )
+    lines.append("END:VCALENDAR")
+    return b"".join(fold_line(line) + b"\r\n" for line in lines)
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a timezone-aware datetime as an UTC iCalendar date-time."""
+    return value.astimezone(UTC).strftime("%Y%m%dT%H%M%SZ")
+
+
+def escape_text(value: str) -> str:
+    """Escape a value of type TEXT."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold_line(line: str) -> bytes:
+    """Encode a content line, folding it every 75 octets, without splitting UTF-8 sequences."""
+    data = line.encode("utf-8")
+    if len(data) <= MAX_LINE_LENGTH:
+        return data
+
+    parts = []
+    start = 0
+    # continuation lines start with a space, which counts in their length
+    limit = MAX_LINE_LENGTH
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end])
+        start = end
+        limit = MAX_LINE_LENGTH - 1
+    return b"\r\n ".join(parts)
@@ -0,0 +1,203 @@
+"""Typed records built from the rows returned by Avantio."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+from homeassistant.components.calendar import CalendarEvent
+
+# Status of the bookings made by the owner, as opposed to rentals
+OWNER_STATUS = "PROPIETARIO"
+# Local time of check-ins and check-outs
+CHECK_IN_HOUR = 17
+CHECK_OUT_HOUR = 10
+
+# Month abbreviations used by Avantio dates, whatever the locale of the system
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class Guests:
+    """Guests of a booking."""
+
+    num_adults: int
+    num_children: int
+    num_babies: int
+    children_ages: tuple[int, ...]
+
+    @classmethod
+    def from_row(cls, guests: dict | None) -> Guests | None:
+        """Create the guests from the `guests` object of an Avantio booking row."""
+        if guests is None:
+            return None
+        return cls(
+            num_adults=guests.get("numAdults", 0),
+            num_children=guests.get("numChildren", 0),
+            num_babies=guests.get("numBabies", 0),
+            children_ages=tuple(guests.get("childrenAges", [])),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Booking:
+    """Booking of an accommodation, either by guests or by the owner."""
+
+    id: str
+    accommodation_id: str | None
+    start: datetime
+    end: datetime
+    amount: Decimal
+    status: str
+    agent: str
+    guests: Guests | None
+
+    @classmethod
+    def from_row(cls, row: dict, timezone: ZoneInfo) -> Booking:
+        """Create the booking from an Avantio booking row."""
+        return cls(
+            id=row["id"],
+            accommodation_id=get_accommodation_id(row),
+            start=datetime.combine(parse_date(row["bookingStart"]), time(CHECK_IN_HOUR), timezone),
+            end=datetime.combine(parse_date(row["bookingEnd"]), time(CHECK_OUT_HOUR), timezone),
+            amount=parse_amount(row["amount"]),
+            status=row["status"]["name"],
+            agent=row["agent"]["name"],
+            guests=Guests.from_row(row["guests"]),
+        )
+
+    @classmethod
+    def from_list(cls, values: list) -> Booking:
+        """Create the booking from its compact serialized form, see `as_list`."""
+        (booking_id, accommodation_id, start, end, amount, status, agent, guests) = values
+        return cls(
+            id=booking_id,
+            accommodation_id=accommodation_id,
+            start=datetime.fromisoformat(start),
+            end=datetime.fromisoformat(end),
+            amount=Decimal(amount),
+            status=status,
+            agent=agent,
+            guests=Guests(*guests[:3], tuple(guests[3])) if guests is not None else None,
+        )
+
+    def as_list(self) -> list:
+        """Serialize the booking into a compact, JSON compatible, form."""
+        return [
+            self.id,
+            self.accommodation_id,
+            self.start.isoformat(),
+            self.end.isoformat(),
+            str(self.amount),
+            self.status,
+            self.agent,
+            [
+                self.guests.num_adults,
+                self.guests.num_children,
+                self.guests.num_babies,
+                list(self.guests.children_ages),
+            ]
+            if self.guests is not None
+            else None,
+        ]
+
+    @property
+    def is_rental(self) -> bool:
+        """Whether the booking is a rental, rather than a stay of the owner."""
+        return self.status != OWNER_STATUS
+
+    @property
+    def description(self) -> str:
+        """Render the description of the booking, for calendar events."""
+        return "\n".join(
+            [
+                f"🧑‍🧑‍🧒‍🧒 {stringify_guests(self.guests)}",
+                f"💸 {self.amount:,.2f} €" if self.is_rental else "",
+                "",
+                f"Réservé via {self.agent}" if self.agent != "" else "",
+            ]
+        )
+
+    def to_calendar_event(self) -> CalendarEvent:
+        """Create the calendar event of the booking."""
+        return CalendarEvent(
+            uid=self.id,
+            start=self.start,
+            end=self.end,
+            summary=self.id,
+            description=self.description,
+        )
+
+
+def get_accommodation_id(row: dict) -> str | None:
+    """Get the id of the accommodation a booking is for, as a string, or None if the row does not tell.
+
+    The id is read from `accommodation.id`, or else from `accommodationId`. Neither field is documented, nor has
+    been checked against a `fetchOwnerBookings` response yet. When both are missing, the coordinator assigns the
+    booking to the accommodation of the account if it has only one, and fails the refresh otherwise.
+    """
+    accommodation = row.get("accommodation")
+    accommodation_id = (
+        accommodation.get("id") if isinstance(accommodation, dict) else row.get("accommodationId")
+    )
+    return str(accommodation_id) if accommodation_id is not None else None
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> date:
+    """Parse a date in the format '%d %b %Y'.
+
+    Many bookings share the same dates, hence parsed dates are cached.
+    """
+    day, month, year = date_str.split()
+    return date(int(year), MONTHS[month[:3].title()], int(day))
+
+
+def parse_amount(amount: str) -> Decimal:
+    """Parse an amount in the format '1,234.56€'."""
+    return Decimal(amount.replace(",", "").replace("€", "").strip())
+
+
+def stringify_guests(guests: Guests | None) -> str:
+    """Stringify the guests information."""
+    if guests is None:
+        return "**Unknown**"
+
+    num_adults = guests.num_adults
+    num_children = guests.num_children
+    num_babies = guests.num_babies
+    children_ages = [age for age in guests.children_ages if age > 0]
+
+    parts = []
+
+    total_people = num_adults + num_children + num_babies
+    if total_people > 0:
+        parts.append(f"{total_people} personnes")
+
+    breakdown = []
+    if num_adults > 0:
+        breakdown.append(f"{num_adults} adultes")
+
+    if num_children > 0:
+        breakdown.append(f"{num_children} enfants")
+
+    if num_babies > 0:
+        breakdown.append(f"{num_babies} bébés")
+
+    details = []
+    if len(breakdown) > 0:
+        details.append(", ".join(breakdown))
+    if len(children_ages) > 0:
+        ages = ", ".join(map(str, children_ages))
+        details.append(f"(ages {ages} ans)")
+
+    if len(details) > 0:
+        parts.append(" ".join(details))
+
+    return " – ".join(parts)
@@ -0,0 +1,106 @@
+"""Day by day occupancy of an accommodation, answering availability queries without scanning its bookings."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+from itertools import accumulate
+import sys
+
+from .models import Booking
+
+# Flags of each day: whether the night starting that day is booked by guests or by the owner, and whether a stay
+# checks in or out that day
+RENTAL = 1
+OWNER = 2
+CHECK_IN = 4
+CHECK_OUT = 8
+OCCUPIED = RENTAL | OWNER
+
+
+class DayOccupancy:
+    """Occupancy of an accommodation, as one byte of flags per day from its first check-in to its last check-out.
+
+    Days outside of that range are free. Built once per change of the bookings of the accommodation, after which
+    a day is looked up in constant time, and so is whether a range of nights is free, thanks to prefix sums of the
+    occupied nights.
+    """
+
+    __slots__ = ("_origin", "_days", "_occupied_sums", "_gaps")
+
+    def __init__(self, bookings: Iterable[Booking] = ()) -> None:
+        """Build the occupancy of the given bookings."""
+        stays = [
+            (booking.start.date(), booking.end.date(), RENTAL if booking.is_rental else OWNER)
+            for booking in bookings
+            if booking.end.date() >= booking.start.date()
+        ]
+        self._origin = min((start for start, _, _ in stays), default=date.min)
+        size = max(((end - self._origin).days + 1 for _, end, _ in stays), default=0)
+        days = bytearray(size)
+        for start, end, flag in stays:
+            first = (start - self._origin).days
+            last = (end - self._origin).days
+            for index in range(first, last):
+                days[index] |= flag
+            days[first] |= CHECK_IN
+            days[last] |= CHECK_OUT
+        self._days = days
+        self._occupied_sums = list(accumulate((1 if flags & OCCUPIED else 0 for flags in days), initial=0))
+        # Start of each run of free nights from the origin, in order, along with its end, excluded. The last run is
+        # endless, since all the nights after the last check-out are free.
+        self._gaps: list[tuple[int, int]] = []
+        start = None
+        for index, flags in enumerate(days):
+            if flags & OCCUPIED:
+                if start is not None:
+                    self._gaps.append((start, index))
+                    start = None
+            elif start is None:
+                start = index
+        if start is not None:
+            self._gaps.append((start, sys.maxsize))
+
+    def _index(self, day: date) -> int:
+        """Return the index of the given day in the bitmap, which may be out of its range."""
+        return (day - self._origin).days
+
+    def flags(self, day: date) -> int:
+        """Return the flags of the given day."""
+        index = self._index(day)
+        return self._days[index] if 0 <= index < len(self._days) else 0
+
+    def is_occupied(self, day: date) -> bool:
+        """Return whether the night starting on the given day is booked, by guests or by the owner."""
+        return bool(self.flags(day) & OCCUPIED)
+
+    def is_changeover(self, day: date) -> bool:
+        """Return whether a stay checks out on the given day, so the accommodation has to be cleaned."""
+        return bool(self.flags(day) & CHECK_OUT)
+
+    def occupied_nights(self, start: date, end: date) -> int:
+        """Return the number of nights booked from `start` to `end`, excluded."""
+        size = len(self._days)
+        first = min(max(self._index(start), 0), size)
+        last = min(max(self._index(end), first), size)
+        return self._occupied_sums[last] - self._occupied_sums[first]
+
+    def is_free(self, start: date, end: date) -> bool:
+        """Return whether all the nights from `start` to `end`, excluded, are free."""
+        return self.occupied_nights(start, end) == 0
+
+    def next_free(self, start: date, nights: int) -> date:
+        """Return the first day, from the given one, from which the given number of nights are all free."""
+        index = self._index(start)
+        if index >= len(self._days) or -index >= nights:
+            # after the last check-out, or early enough before the first check-in
+            return start
+        index = max(index, 0)
+        # the gap containing the start, if any, then the following ones
+        position = max(bisect_right(self._gaps, (index, sys.maxsize)) - 1, 0)
+        for gap_start, gap_end in self._gaps[position:]:
+            first = max(gap_start, index)
+            if gap_end - first >= nights:
+                return self._origin + timedelta(days=first)
+        raise AssertionError("the last gap is endless")
@@ -0,0 +1,68 @@
+"""Pool of the Avantio clients of all config entries, sharing the same request limits."""
+
+import asyncio
+import logging
+import random
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .client import AvantioClient, RequestLimiter
+from .const import DOMAIN
+from .coordinator import AvantioCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AvantioClientPool:
+    """Create the clients of all accounts, and schedule their refreshes, within shared request limits."""
+
+    def __init__(self, max_concurrent: int, max_per_second: float, startup_jitter: float) -> None:
+        """Initialise the pool."""
+        self._limiter = RequestLimiter(max_concurrent, max_per_second)
+        self._startup_jitter = startup_jitter
+        # Clients signed in by config flows, by username, waiting for the setup of their entry
+        self._handed_off: dict[str, AvantioClient] = {}
+
+    def create_client(self, hass: HomeAssistant, username: str, password: str) -> AvantioClient:
+        """Create the client of an account, going through the shared limiter."""
+        # Dedicated session on top of Home Assistant's shared connector, so the cookies of this account are kept
+        # across refreshes without leaking to other entries.
+        return AvantioClient(
+            username=username,
+            password=password,
+            session=async_create_clientsession(hass),
+            limiter=self._limiter,
+        )
+
+    def hand_off(self, hass: HomeAssistant, client: AvantioClient) -> None:
+        """Keep a client signed in by a config flow, for the setup of its entry to reuse its session."""
+        previous = self._handed_off.pop(client.username, None)
+        if previous is not None:
+            hass.async_create_task(previous.close())
+        self._handed_off[client.username] = client
+
+    def get_client(self, hass: HomeAssistant, username: str, password: str) -> AvantioClient:
+        """Return the client of an account handed off by its config flow, already signed in, or create one."""
+        client = self._handed_off.pop(username, None)
+        if client is not None:
+            if client.has_credentials(username, password):
+                _LOGGER.debug("Reusing the session signed in by the config flow of %s", username)
+                return client
+            hass.async_create_task(client.close())
+        return self.create_client(hass, username, password)
+
+    def schedule_refresh(self, hass: HomeAssistant, entry: ConfigEntry, coordinator: AvantioCoordinator) -> None:
+        """Refresh the coordinator in the background, after a random delay to spread the accounts over time."""
+        delay = random.uniform(0, self._startup_jitter)
+        _LOGGER.debug("Refreshing %s in %.1f seconds", entry.entry_id, delay)
+        entry.async_create_background_task(
+            hass, self._async_delayed_refresh(coordinator, delay), f"{DOMAIN} refresh {entry.entry_id}"
+        )
+
+    @staticmethod
+    async def _async_delayed_refresh(coordinator: AvantioCoordinator, delay: float) -> None:
+        """Refresh the coordinator after the given delay, in seconds."""
+        await asyncio.sleep(delay)
+        await coordinator.async_refresh()
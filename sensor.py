@@ -1,14 +1,23 @@
 """Add sensor entities for a given HomeAssistant ConfigEntry."""
 
+from collections.abc import Callable
+from datetime import datetime
+from decimal import Decimal
+
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity_registry import Platform
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .coordinator import AvantioCoordinator
+from .analytics import MonthlyTotals, month_index, month_start
+from .const import DOMAIN, SIGNAL_REFRESH_STATS
+from .coordinator import AvantioCoordinator, RefreshStats
 
 
 async def async_setup_entry(
@@ -19,37 +28,249 @@ async def async_setup_entry(
     """Set up the sensor platform from a config entry."""
     coordinator: AvantioCoordinator = hass.data[DOMAIN][entry.entry_id]
 
+    entities = []
     for accommodation in coordinator.get_accommodations():
-        async_add_entities([TotalEarningsSensor(coordinator=coordinator, unique_id=f"{accommodation["id"]}_total_earnings")], True)
+        entities.extend(
+            [
+                TotalEarningsSensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_total_earnings",
+                ),
+                PeriodSensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_monthly_earnings",
+                    translation_key="monthly_earnings",
+                    months=1,
+                    value_fn=lambda totals, first, last: totals.earnings(first, last),
+                    device_class=SensorDeviceClass.MONETARY,
+                    unit="€",
+                ),
+                PeriodSensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_rolling_earnings",
+                    translation_key="rolling_earnings",
+                    months=12,
+                    value_fn=lambda totals, first, last: totals.earnings(first, last),
+                    device_class=SensorDeviceClass.MONETARY,
+                    unit="€",
+                ),
+                PeriodSensor(
+                    coordinator=coordinator,
+                    accommodation_id=accommodation["id"],
+                    unique_id=f"{accommodation['id']}_monthly_occupancy",
+                    translation_key="monthly_occupancy",
+                    months=1,
+                    value_fn=lambda totals, first, last: round(totals.occupancy(first, last) * 100, 1),
+                    unit=PERCENTAGE,
+                ),
+            ]
+        )
+
+    entities.extend(
+        [
+            RefreshStatsSensor(
+                coordinator=coordinator,
+                unique_id=f"{entry.entry_id}_last_refresh_duration",
+                translation_key="last_refresh_duration",
+                value_fn=lambda stats: round(stats.duration, 3),
+                device_class=SensorDeviceClass.DURATION,
+                unit=UnitOfTime.SECONDS,
+            ),
+            RefreshStatsSensor(
+                coordinator=coordinator,
+                unique_id=f"{entry.entry_id}_last_refresh_requests",
+                translation_key="last_refresh_requests",
+                value_fn=lambda stats: stats.client.requests,
+            ),
+            RefreshStatsSensor(
+                coordinator=coordinator,
+                unique_id=f"{entry.entry_id}_last_refresh_bytes",
+                translation_key="last_refresh_bytes",
+                value_fn=lambda stats: stats.client.bytes_received,
+                device_class=SensorDeviceClass.DATA_SIZE,
+                unit=UnitOfInformation.BYTES,
+            ),
+        ]
+    )
 
-    await coordinator.async_request_refresh()
+    async_add_entities(entities)
 
 
 class TotalEarningsSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Sensor that shows the total earnings."""
+    """Representation of a Sensor that shows the total earnings of an accommodation."""
 
     coordinator: AvantioCoordinator
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator: AvantioCoordinator, unique_id: str) -> None:
+    def __init__(self, coordinator: AvantioCoordinator, accommodation_id, unique_id: str) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
+        self._accommodation_id = accommodation_id
         self.entity_id = f"{Platform.SENSOR}.{DOMAIN}_{unique_id}"
         self._attr_translation_key = "total_earnings"
         if unique_id is not None:
             self._attr_unique_id = unique_id
         self._attr_device_class = SensorDeviceClass.MONETARY
         self._attr_native_unit_of_measurement = "€"
+        self._earnings = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, if the earnings or the availability changed."""
+        earnings = (
+            self.coordinator.get_total_earnings(self._accommodation_id),
+            self.coordinator.get_yearly_earnings(self._accommodation_id),
+            self.available,
+        )
+        if earnings == self._earnings:
+            return
+        self._earnings = earnings
+        self.async_write_ha_state()
 
     @property
     def state(self):
         """Return the state of the sensor."""
-        return self.coordinator.get_total_earnings()
+        return self.coordinator.get_total_earnings(self._accommodation_id)
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
         return {
             year: f"{round(value, 2)} €"
-            for year, value in self.coordinator.get_yearly_earnings().items()
+            for year, value in self.coordinator.get_yearly_earnings(self._accommodation_id).items()
+        }
+
+
+class PeriodSensor(CoordinatorEntity, SensorEntity):
+    """Representation of a Sensor that shows the earnings or occupancy of an accommodation over the last months.
+
+    The period ends with the current month, and moves forward at midnight on the first day of each month.
+    """
+
+    coordinator: AvantioCoordinator
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: AvantioCoordinator,
+        accommodation_id,
+        unique_id: str,
+        translation_key: str,
+        months: int,
+        value_fn: Callable[[MonthlyTotals, int, int], Decimal | float],
+        device_class: SensorDeviceClass | None = None,
+        unit: str | None = None,
+    ) -> None:
+        """Initialize the sensor.
+
+        value_fn: called with the monthly totals of the accommodation, and the indexes of the first and last months
+        of the period.
+        """
+        super().__init__(coordinator)
+        self.entity_id = f"{Platform.SENSOR}.{DOMAIN}_{unique_id}"
+        self._attr_unique_id = unique_id
+        self._attr_translation_key = translation_key
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._accommodation_id = accommodation_id
+        self._months = months
+        self._value_fn = value_fn
+        self._value = None
+        self._attributes = None
+        self._available = None
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the state, and move the period forward at the start of each month."""
+        await super().async_added_to_hass()
+        self._update_value()
+        self.async_on_remove(
+            async_track_time_change(self.hass, self._handle_midnight, hour=0, minute=0, second=0)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, if the value or the availability changed."""
+        if self._update_value():
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_midnight(self, now: datetime) -> None:
+        """Move the period forward on the first day of the month."""
+        if now.day == 1 and self._update_value():
+            self.async_write_ha_state()
+
+    def _update_value(self) -> bool:
+        """Compute the value over the current period, in constant time.
+
+        Returns whether the value, or the availability, changed since the state was last written.
+        """
+        last = month_index(dt_util.now().date())
+        first = last - self._months + 1
+        totals = self.coordinator.get_analytics(self._accommodation_id)
+        value = self._value_fn(totals, first, last)
+        attributes = {
+            "period_start": month_start(first).isoformat(),
+            "nights": totals.nights(first, last),
         }
+        if (value, attributes, self.available) == (self._value, self._attributes, self._available):
+            return False
+        self._value = value
+        self._attributes = attributes
+        self._available = self.available
+        return True
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._value
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes, i.e. the start of the period and the nights booked over it."""
+        return self._attributes
+
+
+class RefreshStatsSensor(SensorEntity):
+    """Representation of a diagnostic Sensor that shows a statistic of the last coordinator refresh."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinator: AvantioCoordinator,
+        unique_id: str,
+        translation_key: str,
+        value_fn: Callable[[RefreshStats], float | int],
+        device_class: SensorDeviceClass | None = None,
+        unit: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.entity_id = f"{Platform.SENSOR}.{DOMAIN}_{unique_id}"
+        self._attr_unique_id = unique_id
+        self._attr_translation_key = translation_key
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._value_fn = value_fn
+
+    async def async_added_to_hass(self) -> None:
+        """Update the sensor after each refresh of the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_REFRESH_STATS.format(self.coordinator.config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        stats = self.coordinator.get_last_refresh()
+        return self._value_fn(stats) if stats is not None else None
@@ -0,0 +1,76 @@
+"""Services of the Avantio integration."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_ACCOMMODATION_ID,
+    ATTR_END_DATE,
+    ATTR_NIGHTS,
+    ATTR_START_DATE,
+    DOMAIN,
+    SERVICE_CHECK_AVAILABILITY,
+)
+from .coordinator import AvantioCoordinator
+
+CHECK_AVAILABILITY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_START_DATE): cv.date,
+        vol.Exclusive(ATTR_END_DATE, "length"): cv.date,
+        vol.Exclusive(ATTR_NIGHTS, "length"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_ACCOMMODATION_ID): cv.string,
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def async_check_availability(call: ServiceCall) -> ServiceResponse:
+        """Check whether accommodations are free over a stay, and when they are next free for as long.
+
+        Answered from the occupancy kept by the coordinators, without fetching Avantio.
+        """
+        start = call.data[ATTR_START_DATE]
+        if ATTR_END_DATE in call.data:
+            nights = (call.data[ATTR_END_DATE] - start).days
+            if nights <= 0:
+                raise ServiceValidationError(f"{ATTR_END_DATE} must be after {ATTR_START_DATE}")
+        else:
+            nights = call.data.get(ATTR_NIGHTS, 1)
+        end = start + timedelta(days=nights)
+
+        accommodations = []
+        coordinator: AvantioCoordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            for accommodation in coordinator.get_accommodations():
+                accommodation_id = str(accommodation["id"])
+                if call.data.get(ATTR_ACCOMMODATION_ID, accommodation_id) != accommodation_id:
+                    continue
+                occupancy = coordinator.get_occupancy(accommodation_id)
+                accommodations.append(
+                    {
+                        ATTR_ACCOMMODATION_ID: accommodation_id,
+                        "name": accommodation.get("name"),
+                        "available": occupancy.is_free(start, end),
+                        "next_available": occupancy.next_free(start, nights).isoformat(),
+                    }
+                )
+
+        return {"nights": nights, "accommodations": accommodations}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CHECK_AVAILABILITY,
+        async_check_availability,
+        schema=CHECK_AVAILABILITY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )